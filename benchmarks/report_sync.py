@@ -0,0 +1,117 @@
+"""Benchmark syncing report rows through `request_records`.
+
+Syncs campaign summary site daily report rows for one account from the mock API,
+and reports the time taken and the peak memory of the process for each
+configuration. Each configuration runs in a fresh process, so peak memory is not
+shared between them. Both include generating the mock responses, which is the same
+for every configuration.
+
+Usage:
+    python benchmarks/report_sync.py [SITES_PER_CAMPAIGN]
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+
+from tap_taboola.streams import (
+    CampaignDailyRollupStream,
+    CampaignSummarySiteDailyReport,
+)
+from tap_taboola.tap import TapTaboola
+
+REPORT = CampaignSummarySiteDailyReport.name
+ROLLUP = CampaignDailyRollupStream.name
+DAYS = 7
+
+# name: (extra config, selected streams, selected report columns or all if None)
+CONFIGURATIONS = {
+    "all columns": ({}, {REPORT}, None),
+    "selected columns": ({}, {REPORT}, {"date", "campaign", "site_id", "clicks"}),
+    "deduplicated": ({"deduplicate_report_rows": True}, {REPORT}, None),
+    "rollup only": ({}, {ROLLUP}, None),
+}
+
+
+def make_tap(name: str, sites_per_campaign: int) -> TapTaboola:
+    """Return a tap syncing a configuration from the mock API."""
+    extra_config, selected_streams, columns = CONFIGURATIONS[name]
+    start_date = datetime.now(tz=timezone.utc).date() - timedelta(days=DAYS - 1)
+    config = {
+        "client_id": "benchmark",
+        "client_secret": "benchmark",
+        "start_date": start_date.isoformat(),
+        "mock_api": {
+            "accounts": 1,
+            "campaigns_per_account": 100,
+            "sites_per_campaign": sites_per_campaign,
+        },
+        **extra_config,
+    }
+
+    catalog = TapTaboola(config=config).catalog_dict
+
+    for entry in catalog["streams"]:
+        for metadata in entry["metadata"]:
+            breadcrumb = metadata["breadcrumb"]
+
+            if not breadcrumb:
+                metadata["metadata"]["selected"] = (
+                    entry["tap_stream_id"] in selected_streams
+                )
+            elif columns is not None and entry["tap_stream_id"] == REPORT:
+                metadata["metadata"]["selected"] = breadcrumb[-1] in columns
+
+    return TapTaboola(config=config, catalog=catalog)
+
+
+def run(name: str, sites_per_campaign: int) -> tuple[float, float]:
+    """Sync report rows for a configuration, in the current process.
+
+    Returns:
+        The number of seconds taken, and the peak memory of the process in MB.
+    """
+    # rollup streams write their records and state as days complete
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):  # noqa: PTH123
+        tap = make_tap(name, sites_per_campaign)
+        stream = tap.streams[REPORT]
+        stream.context = context = {"account_id": "mock-account-1"}
+        start = time.perf_counter()
+
+        try:
+            deque(stream.request_records(context), maxlen=0)
+        finally:
+            tap.report_scheduler.shutdown()
+
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3  # KB on Linux
+
+    return elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark."""
+    sites_per_campaign = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    rows = DAYS * 100 * sites_per_campaign
+    context = multiprocessing.get_context("spawn")
+
+    print(f"{rows} rows over {DAYS} days")  # noqa: T201
+    print(f"{'configuration':<20}{'time (s)':>12}{'peak MB':>12}")  # noqa: T201
+
+    for name in CONFIGURATIONS:
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            elapsed, peak = executor.submit(run, name, sites_per_campaign).result()
+
+        print(f"{name:<20}{elapsed:>12.2f}{peak:>12.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -2,19 +2,61 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 
-from singer_sdk.authenticators import OAuthAuthenticator, SingletonMeta
+import requests
+from singer_sdk import authenticators
+from singer_sdk.authenticators import OAuthAuthenticator
 from typing_extensions import override
 
 if TYPE_CHECKING:
     from tap_taboola.client import TaboolaStream
 
+# the SDK requests tokens with `requests.post`, which is swapped for one authenticator
+# at a time
+_sdk_requests_lock = threading.Lock()
 
-# The SingletonMeta metaclass makes your streams reuse the same authenticator instance.
-# If this behaviour interferes with your use-case, you can remove the metaclass.
-class TaboolaAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
-    """Authenticator class for Taboola."""
+
+class _SessionRequests:
+    """The `requests` module, with POST requests made over a session."""
+
+    def __init__(self, session: requests.Session) -> None:
+        self._session = session
+
+    def post(self, *args, **kwargs) -> requests.Response:
+        # the session authenticates its requests with the token being requested
+        return self._session.post(*args, auth=lambda request: request, **kwargs)
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(requests, name)
+
+
+class TaboolaAuthenticator(OAuthAuthenticator):
+    """Authenticator class for Taboola.
+
+    A single authenticator is shared by all streams of a tap, so they all use the same
+    access token.
+    """
+
+    def __init__(
+        self,
+        stream: TaboolaStream,
+        *args,
+        session: requests.Session | None = None,
+        **kwargs,
+    ) -> None:
+        """Create a new authenticator.
+
+        Args:
+            stream: The stream instance to use with this authenticator.
+            args: Positional arguments for `OAuthAuthenticator`.
+            session: Session to request tokens over, instead of a new connection.
+            kwargs: Keyword arguments for `OAuthAuthenticator`.
+        """
+        super().__init__(stream, *args, **kwargs)
+        self._lock = threading.Lock()
+        self._session = session
 
     @override
     @property
@@ -25,12 +67,36 @@ class TaboolaAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
             "grant_type": "client_credentials",
         }
 
+    @override
+    def update_access_token(self):
+        # only let one thread refresh an expired token, and have the others use it
+        with self._lock:
+            if self.is_token_valid():
+                return
+
+            if self._session is None:
+                super().update_access_token()
+                return
+
+            with _sdk_requests_lock:
+                authenticators.requests = _SessionRequests(self._session)  # type: ignore[assignment]
+
+                try:
+                    super().update_access_token()
+                finally:
+                    authenticators.requests = requests
+
     @classmethod
-    def create_for_stream(cls, stream: TaboolaStream) -> TaboolaAuthenticator:
+    def create_for_stream(
+        cls,
+        stream: TaboolaStream,
+        session: requests.Session | None = None,
+    ) -> TaboolaAuthenticator:
         """Instantiate an authenticator for a specific Singer stream.
 
         Args:
             stream: The Singer stream instance.
+            session: Session to request tokens over, instead of a new connection.
 
         Returns:
             A new authenticator.
@@ -38,4 +104,5 @@ class TaboolaAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
         return cls(
             stream=stream,
             auth_endpoint="https://backstage.taboola.com/backstage/oauth/token",
+            session=session,
         )
@@ -0,0 +1,184 @@
+"""Local caches for tap-taboola."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CachedRecords(NamedTuple):
+    """Records loaded from a cache file."""
+
+    records: list[dict]
+    expired: bool
+
+
+class RecordCache:
+    """JSON file cache of records with a time-to-live."""
+
+    def __init__(self, path: Path, ttl: float) -> None:
+        """Initialise the cache.
+
+        Args:
+            path: Cache file path.
+            ttl: Number of seconds cached records are considered fresh for.
+        """
+        self.path = path
+        self.ttl = ttl
+
+    def load(self) -> CachedRecords | None:
+        """Load cached records.
+
+        Returns:
+            The cached records, or ``None`` if the cache does not exist or cannot be
+            read.
+        """
+        try:
+            with self.path.open() as f:
+                cache = json.load(f)
+
+            cached_at = float(cache["cached_at"])
+            records = list(cache["records"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        return CachedRecords(records, expired=time.time() - cached_at > self.ttl)
+
+    def save(self, records: list[dict]) -> None:
+        """Save records to the cache.
+
+        Args:
+            records: The records to cache.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first so an interrupted run cannot leave a
+        # partially-written cache behind
+        tmp_path = self.path.with_suffix(".tmp")
+
+        with tmp_path.open("w") as f:
+            json.dump({"cached_at": time.time(), "records": records}, f, default=str)
+
+        tmp_path.replace(self.path)
+
+
+class RecordHashIndex:
+    """JSON file index of record content hashes, by partition and primary key.
+
+    Hashes are 8-byte BLAKE2 digests, so the index stays small even for hundreds of
+    thousands of records.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialise the index, loading any hashes saved by a previous run.
+
+        Args:
+            path: Index file path to load, or ``None`` to start with an empty index.
+        """
+        self._seen: dict[str, set[str]] = {}
+        self._listed: set[str] = set()
+        self._hashes: dict[str, dict[str, str]] = {}
+
+        if path is None:
+            return
+
+        try:
+            with path.open() as f:
+                self._hashes = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def partitions(self) -> list[str]:
+        """Return the partitions with records in the index.
+
+        Returns:
+            The partitions.
+        """
+        return list(self._hashes)
+
+    def update(self, partition: str, key: str, record: dict) -> bool:
+        """Update the hash of a record.
+
+        Args:
+            partition: The partition the record belongs to.
+            key: The record primary key.
+            record: The record.
+
+        Returns:
+            ``True`` if the record is new or has changed since it was last updated.
+        """
+        content = json.dumps(record, sort_keys=True, default=str).encode()
+        digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+        hashes = self._hashes.setdefault(partition, {})
+
+        if hashes.get(key) == digest:
+            return False
+
+        hashes[key] = digest
+        return True
+
+    def mark_seen(self, partition: str, key: str) -> None:
+        """Mark a record as still existing in the source.
+
+        Args:
+            partition: The partition the record belongs to.
+            key: The record primary key.
+        """
+        self._seen.setdefault(partition, set()).add(key)
+
+    def mark_listed(self, partition: str) -> None:
+        """Mark every record of a partition as listed.
+
+        Records of the partition which were not marked as seen are then considered
+        deleted.
+
+        Args:
+            partition: The partition that was listed.
+        """
+        self._listed.add(partition)
+
+    def pop_deleted(self) -> list[tuple[str, str]]:
+        """Remove records deleted from listed partitions.
+
+        Partitions left without records are removed too.
+
+        Returns:
+            Pairs of partition and primary key of the removed records.
+        """
+        deleted: list[tuple[str, str]] = []
+
+        for partition in self._listed:
+            hashes = self._hashes.get(partition, {})
+            seen = self._seen.pop(partition, set())
+            keys = [key for key in hashes if key not in seen]
+
+            for key in keys:
+                del hashes[key]
+
+            if not hashes:
+                self._hashes.pop(partition, None)
+
+            deleted.extend((partition, key) for key in keys)
+
+        self._listed.clear()
+        return deleted
+
+    def save(self, path: Path) -> None:
+        """Save the index.
+
+        Args:
+            path: Index file path.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+
+        with tmp_path.open("w") as f:
+            json.dump(self._hashes, f, separators=(",", ":"))
+
+        tmp_path.replace(path)
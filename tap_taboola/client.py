@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import decimal
 import typing as t
-from functools import cached_property
 from importlib import resources
 
 from singer_sdk.helpers.jsonpath import extract_jsonpath
@@ -12,12 +11,14 @@ from singer_sdk.pagination import SinglePagePaginator
 from singer_sdk.streams import RESTStream
 from typing_extensions import override
 
-from tap_taboola.auth import TaboolaAuthenticator
+from tap_taboola.session import wire_bytes
 
 if t.TYPE_CHECKING:
     import requests
     from singer_sdk.helpers.types import Auth, Context
 
+    from tap_taboola.tap import TapTaboola
+
 
 # TODO: Delete this is if not using json files for schema definition
 SCHEMAS_DIR = resources.files(__package__) / "schemas"
@@ -33,14 +34,21 @@ class TaboolaStream(RESTStream):
 
     url_base = "https://backstage.taboola.com/backstage/api/1.0"
 
-    @cached_property
+    @override
+    @property
     def authenticator(self) -> Auth:
-        """Return a new authenticator object.
+        # share a single access token between all streams
+        return self._taboola_tap.authenticator
 
-        Returns:
-            An authenticator instance.
-        """
-        return TaboolaAuthenticator.create_for_stream(self)
+    @override
+    @property
+    def requests_session(self) -> requests.Session:
+        # share a single connection pool between all streams
+        return self._taboola_tap.requests_session
+
+    @property
+    def _taboola_tap(self) -> TapTaboola:
+        return t.cast("TapTaboola", self._tap)
 
     @property
     def http_headers(self) -> dict:
@@ -55,6 +63,22 @@ class TaboolaStream(RESTStream):
     def get_new_paginator(self):
         return SinglePagePaginator()
 
+    @override
+    def calculate_sync_cost(self, request, response, context):
+        # costs are summed for each stream and logged at the end of its sync
+        costs = {"requests": 1, "decompressed_bytes": len(response.content)}
+
+        # fall back to the size the server declared, and leave it out if unknown
+        compressed_bytes = wire_bytes(response)
+
+        if compressed_bytes is None and "Content-Length" in response.headers:
+            compressed_bytes = int(response.headers["Content-Length"])
+
+        if compressed_bytes is not None:
+            costs["compressed_bytes"] = compressed_bytes
+
+        return costs
+
     def get_url_params(
         self,
         context: Context | None,  # noqa: ARG002
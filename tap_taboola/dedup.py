@@ -0,0 +1,61 @@
+"""Report row deduplication for tap-taboola."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+
+class SeenKeyIndex:
+    """Index of primary keys already emitted for each open report window.
+
+    Keys are stored as 64-bit hashes, so memory is bounded by the number of distinct
+    rows in the windows that are still open. A window is evicted once it closes.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the index."""
+        self._lock = threading.Lock()
+        self._windows: dict[Hashable, set[int]] = {}
+        self.dropped = 0
+
+    def filter(
+        self,
+        window: Hashable,
+        rows: Iterable[dict],
+        key: Callable[[dict], Hashable],
+    ) -> Iterator[dict]:
+        """Drop rows whose key has already been seen in a window.
+
+        Args:
+            window: The window the rows belong to.
+            rows: Rows to filter.
+            key: Function returning the primary key of a row.
+
+        Yields:
+            Each row not seen before.
+        """
+        with self._lock:
+            seen = self._windows.setdefault(window, set())
+
+        for row in rows:
+            hashed_key = hash(key(row))
+
+            if hashed_key in seen:
+                self.dropped += 1
+                continue
+
+            seen.add(hashed_key)
+            yield row
+
+    def evict(self, window: Hashable) -> None:
+        """Forget all keys seen in a window.
+
+        Args:
+            window: The window to evict.
+        """
+        with self._lock:
+            self._windows.pop(window, None)
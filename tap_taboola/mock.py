@@ -0,0 +1,354 @@
+"""Offline stand-in for the Taboola Backstage API, for local load testing."""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import io
+import json
+import random
+import re
+import threading
+import time
+from datetime import date
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlparse
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+_ACCOUNT_PATH = re.compile(r"/backstage/api/1\.0/(?P<account_id>[^/]+)(?P<path>/.*)")
+_CHUNK_SIZE = 8192
+_ITEMS_PATH = re.compile(r"/campaigns/(?P<campaign_id>[^/]+)/items")
+
+
+class MockAPIAdapter(BaseAdapter):
+    """Transport adapter serving synthetic data in place of the Taboola API.
+
+    Mount it on the session shared by all streams to run the tap without network
+    access or credentials. Data is generated deterministically from ``seed`` for
+    ``accounts``, ``campaigns_per_account`` and days, so runs can be repeated and
+    compared at any scale.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        accounts: int = 3,
+        campaigns_per_account: int = 10,
+        items_per_campaign: int = 5,
+        sites_per_campaign: int = 10,
+        latency: float = 0,
+        rate_limit_rate: float = 0,
+        not_found_rate: float = 0,
+        seed: int = 0,
+        chunked: bool = False,
+    ) -> None:
+        """Initialise the adapter.
+
+        Args:
+            accounts: Number of accounts available to the authenticated principal.
+            campaigns_per_account: Number of campaigns in each account.
+            items_per_campaign: Number of items in each campaign.
+            sites_per_campaign: Number of sites each campaign is reported for.
+            latency: Number of seconds to wait before responding to each request.
+            rate_limit_rate: Fraction of requests to answer with a 429 response.
+            not_found_rate: Fraction of accounts to answer campaign requests for with
+                a 404 response, as for accounts which are listed but inaccessible.
+            seed: Seed for the generated data and injected errors.
+            chunked: Whether to send bodies with chunked transfer encoding, as
+                servers compressing on the fly do, instead of with a content length.
+        """
+        super().__init__()
+        self.accounts = accounts
+        self.campaigns_per_account = campaigns_per_account
+        self.items_per_campaign = items_per_campaign
+        self.sites_per_campaign = sites_per_campaign
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.not_found_rate = not_found_rate
+        self.seed = seed
+        self.chunked = chunked
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._http_adapter = HTTPAdapter()
+
+    def send(self, request, **kwargs):  # noqa: ARG002
+        """Respond to a request.
+
+        Args:
+            request: The prepared request.
+            kwargs: Ignored transport options.
+
+        Returns:
+            The response.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            rate_limited = self._random.random() < self.rate_limit_rate
+
+        url = urlparse(request.url)
+
+        # tokens are not rate limited, as the SDK does not retry their requests
+        if url.path.endswith("/oauth/token"):
+            body = {"access_token": "mock", "token_type": "bearer", "expires_in": 3600}
+        elif rate_limited:
+            return self._respond(request, HTTPStatus.TOO_MANY_REQUESTS, {})
+        elif url.path.endswith("/users/current/allowed-accounts"):
+            body = {"results": [self._account(i) for i in range(self.accounts)]}
+        elif match := _ACCOUNT_PATH.fullmatch(url.path):
+            account_id = match["account_id"]
+            path = match["path"]
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+            if path == "/campaigns" and self._is_not_found(account_id):
+                return self._respond(request, HTTPStatus.NOT_FOUND, {})
+
+            results = self._account_results(account_id, path, params)
+
+            if results is None:
+                return self._respond(request, HTTPStatus.NOT_FOUND, {})
+
+            body = {"results": results}
+        else:
+            return self._respond(request, HTTPStatus.NOT_FOUND, {})
+
+        return self._respond(request, HTTPStatus.OK, body)
+
+    def close(self) -> None:
+        """Clean up adapter specific items."""
+        self._http_adapter.close()
+
+    def _account_results(
+        self,
+        account_id: str,
+        path: str,
+        params: dict,
+    ) -> list | None:
+        if path == "/campaigns":
+            return [
+                self._campaign(account_id, campaign_id)
+                for campaign_id in self._campaign_ids(account_id)
+            ]
+
+        if match := _ITEMS_PATH.fullmatch(path):
+            campaign_id = match["campaign_id"]
+            return [
+                self._item(campaign_id, item_id)
+                for item_id in self._item_ids(campaign_id)
+            ]
+
+        if path == "/allowed-publishers":
+            return [self._publisher(account_id)]
+
+        if path.endswith("/campaign_site_day_breakdown"):
+            day = date.fromisoformat(params["start_date"])
+            return [
+                self._site_row(account_id, campaign_id, site_id, day)
+                for campaign_id in self._campaign_ids(account_id)
+                for site_id in range(1, self.sites_per_campaign + 1)
+            ]
+
+        if path.endswith("/item_breakdown"):
+            day = date.fromisoformat(params["start_date"])
+            return [
+                self._item_row(account_id, campaign_id, item_id, day)
+                for campaign_id in self._campaign_ids(account_id)
+                for item_id in self._item_ids(campaign_id)
+            ]
+
+        return None
+
+    def _is_not_found(self, account_id: str) -> bool:
+        rng = random.Random(f"{self.seed}:not_found:{account_id}")  # noqa: S311
+        return rng.random() < self.not_found_rate
+
+    def _campaign_ids(self, account_id: str) -> list[str]:
+        index = account_id.rsplit("-", 1)[-1]
+        return [f"{index}{i:06d}" for i in range(1, self.campaigns_per_account + 1)]
+
+    def _item_ids(self, campaign_id: str) -> list[str]:
+        return [f"{campaign_id}{i:04d}" for i in range(1, self.items_per_campaign + 1)]
+
+    @staticmethod
+    def _account(index: int) -> dict:
+        return {
+            "id": index + 1,
+            "name": f"Mock Account {index + 1}",
+            "account_id": f"mock-account-{index + 1}",
+            "partner_types": ["ADVERTISER"],
+            "type": "PARTNER",
+            "campaign_types": ["PAID"],
+            "currency": "USD",
+            "time_zone_name": "US/Eastern",
+            "default_platform": "DESK",
+            "is_active": True,
+            "language": "en",
+            "country": "US",
+            "is_fla": False,
+        }
+
+    def _publisher(self, account_id: str) -> dict:
+        index = int(account_id.rsplit("-", 1)[-1])
+        return self._account(index - 1) | {
+            "name": f"Mock Publisher {index}",
+            "partner_types": ["PUBLISHER"],
+        }
+
+    @staticmethod
+    def _campaign(account_id: str, campaign_id: str) -> dict:
+        return {
+            "id": campaign_id,
+            "advertiser_id": account_id,
+            "name": f"Mock Campaign {campaign_id}",
+            "branding_text": "Mock",
+            "pricing_model": "CPC",
+            "cpc": 0.25,
+            "daily_cap": 100.0,
+            "spending_limit": 10000.0,
+            "spending_limit_model": "MONTHLY",
+            "status": "RUNNING",
+            "is_active": True,
+            "start_date": "2020-01-01",
+            "end_date": "9999-12-31",
+        }
+
+    @staticmethod
+    def _item(campaign_id: str, item_id: str) -> dict:
+        return {
+            "id": item_id,
+            "campaign_id": campaign_id,
+            "type": "ITEM",
+            "url": f"https://example.com/{item_id}",
+            "thumbnail_url": f"https://example.com/{item_id}.jpg",
+            "title": f"Mock Item {item_id}",
+            "approval_state": "APPROVED",
+            "is_active": True,
+            "status": "RUNNING",
+        }
+
+    def _metrics(self, *key: object) -> dict:
+        rng = random.Random(":".join(map(str, (self.seed, *key))))  # noqa: S311
+        impressions = rng.randint(0, 100000)
+        visible_impressions = rng.randint(0, impressions)
+        clicks = rng.randint(0, impressions // 100)
+        spent = round(clicks * rng.uniform(0.1, 1), 2)
+        actions = rng.randint(0, clicks)
+        conversions_value = round(actions * rng.uniform(1, 10), 2)
+
+        return {
+            "clicks": clicks,
+            "impressions": impressions,
+            "visible_impressions": visible_impressions,
+            "spent": spent,
+            "conversions_value": conversions_value,
+            "cpa_actions_num": actions,
+            "ctr": clicks * 100 / impressions if impressions else 0,
+            "vctr": clicks * 100 / visible_impressions if visible_impressions else 0,
+            "cpm": spent * 1000 / impressions if impressions else 0,
+            "vcpm": spent * 1000 / visible_impressions if visible_impressions else 0,
+            "cpc": spent / clicks if clicks else 0,
+            "cpa": spent / actions if actions else 0,
+            "roas": conversions_value / spent if spent else 0,
+            "currency": "USD",
+        }
+
+    def _site_row(
+        self,
+        account_id: str,
+        campaign_id: str,
+        site_id: int,
+        day: date,
+    ) -> dict:
+        return {
+            "date": f"{day.isoformat()} 00:00:00.0",
+            "site": f"mock-site-{site_id}",
+            "site_name": f"Mock Site {site_id}",
+            "site_id": site_id,
+            "campaign": campaign_id,
+            "campaign_name": f"Mock Campaign {campaign_id}",
+            "blocking_level": "NONE",
+            **self._metrics(account_id, campaign_id, site_id, day),
+        }
+
+    def _item_row(
+        self,
+        account_id: str,
+        campaign_id: str,
+        item_id: str,
+        day: date,
+    ) -> dict:
+        metrics = self._metrics(account_id, campaign_id, item_id, day)
+        metrics["actions"] = metrics.pop("cpa_actions_num")
+
+        return {
+            "item": item_id,
+            "item_name": f"Mock Item {item_id}",
+            "url": f"https://example.com/{item_id}",
+            "thumbnail_url": f"https://example.com/{item_id}.jpg",
+            "campaign": campaign_id,
+            "campaign_name": f"Mock Campaign {campaign_id}",
+            "content_provider": account_id,
+            "content_provider_name": f"Mock Account {account_id}",
+            **metrics,
+        }
+
+    def _respond(self, request, status: HTTPStatus, body: dict):
+        content = json.dumps(body).encode()
+        headers = {"Content-Type": "application/json"}
+
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            content = gzip.compress(content)
+            headers["Content-Encoding"] = "gzip"
+
+        if self.chunked:
+            headers["Transfer-Encoding"] = "chunked"
+            chunks = [
+                content[i : i + _CHUNK_SIZE]
+                for i in range(0, len(content), _CHUNK_SIZE)
+            ]
+            content = b"".join(
+                b"%x\r\n%s\r\n" % (len(chunk), chunk) for chunk in [*chunks, b""]
+            )
+        else:
+            headers["Content-Length"] = str(len(content))
+
+        # parse the response from the bytes a server would send, so transfer
+        # encoding, compression and payload accounting behave as they do against the
+        # API
+        head = "".join(
+            [
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n",
+                *(f"{k}: {v}\r\n" for k, v in headers.items()),
+                "\r\n",
+            ]
+        )
+        original_response = http.client.HTTPResponse(
+            _Socket(head.encode() + content),  # type: ignore[arg-type]
+            method=request.method,
+        )
+        original_response.begin()
+
+        raw = HTTPResponse(
+            body=original_response,
+            headers=dict(original_response.getheaders()),
+            status=original_response.status,
+            reason=original_response.reason,
+            preload_content=False,
+            original_response=original_response,
+        )
+
+        # build the response as a real HTTP adapter would
+        return self._http_adapter.build_response(request, raw)
+
+
+class _Socket:
+    """Socket to read a response from bytes."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def makefile(self, *args, **kwargs) -> io.BytesIO:  # noqa: ARG002
+        return io.BytesIO(self._data)
@@ -3,21 +3,44 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 
 from singer_sdk.pagination import BaseAPIPaginator
 from typing_extensions import override
 
+if TYPE_CHECKING:
+    from tap_taboola.progress import ReportProgress
+
 
 class DayPaginator(BaseAPIPaginator[date]):
     """Day paginator."""
 
+    def __init__(
+        self,
+        start_value: date,
+        progress: ReportProgress | None = None,
+    ) -> None:
+        """Create a new paginator.
+
+        Args:
+            start_value: First day to request.
+            progress: Report progress used to skip days that are already complete.
+        """
+        super().__init__(start_value)
+        self._progress = progress
+
     @override
     def has_more(self, response):
-        return self.current_value < datetime.now(tz=timezone.utc).date()
+        return self.get_next(response) <= datetime.now(tz=timezone.utc).date()
 
     @override
     def get_next(self, response):
-        return self.current_value + timedelta(days=1)
+        next_value = self.current_value + timedelta(days=1)
+
+        while self._progress and self._progress.is_complete(next_value):
+            next_value += timedelta(days=1)
+
+        return next_value
 
     @override
     def continue_if_empty(self, response):
@@ -0,0 +1,276 @@
+"""Profiling hooks for tap-taboola."""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import FrameType
+
+    from singer_sdk import Stream
+
+PROFILE_OUTPUT_DIR = Path("output")
+
+# stream methods to time, and the phase their time is attributed to
+PROFILED_METHODS = {
+    "request_records": "request_records",
+    "_request": "http",
+    "parse_response": "parse_response",
+    "parse_day_response": "parse_response",
+    "post_process": "post_process",
+    "post_process_page": "post_process",
+    "_generate_record_messages": "conform",
+    "_write_record_message": "write",
+    "_write_state_message": "write",
+}
+
+
+class StackSampler:
+    """Sample the call stacks of threads syncing streams at a fixed interval.
+
+    Samples are attributed to the stream a thread is syncing, and can be written in the
+    collapsed stack format read by flamegraph tools. Threads not syncing a stream are
+    not sampled.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """Initialise the sampler.
+
+        Args:
+            interval: Number of seconds between samples.
+        """
+        self.interval = interval
+        self.stacks: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, stream_for_thread: Callable[[int], str | None]) -> None:
+        """Start sampling.
+
+        Args:
+            stream_for_thread: Function returning the name of the stream a thread is
+                syncing, or ``None`` if it is not syncing one.
+        """
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(stream_for_thread,),
+            name="tap-taboola-sampler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling, and wait for the last sample to be taken."""
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def write(self, stream_name: str, output_dir: Path) -> Path | None:
+        """Write the stacks sampled for a stream.
+
+        Args:
+            stream_name: Name of the stream.
+            output_dir: Directory to write the stacks to.
+
+        Returns:
+            The path written to, or ``None`` if there were no samples.
+        """
+        with self._lock:
+            stacks = self.stacks.pop(stream_name, None)
+
+        if not stacks:
+            return None
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / f"{stream_name}.collapsed"
+        path.write_text("".join(f"{s} {n}\n" for s, n in stacks.most_common()))
+
+        return path
+
+    def _run(self, stream_for_thread: Callable[[int], str | None]) -> None:
+        while not self._stopped.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():  # noqa: SLF001
+                if stream_name := stream_for_thread(thread_id):
+                    self._sample(stream_name, frame)
+
+    def _sample(self, stream_name: str, frame: FrameType | None) -> None:
+        names = []
+
+        # only read code objects, which does not disturb the sampled thread
+        while frame is not None:
+            code = frame.f_code
+            name = getattr(code, "co_qualname", code.co_name)  # Python 3.11+
+            names.append(
+                f"{name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+
+        with self._lock:
+            self.stacks[stream_name][";".join(reversed(names))] += 1
+
+
+class Profiler:
+    """Time each phase of syncing streams.
+
+    Time is exclusive, so time spent in a phase nested inside another (such as
+    `post_process_page` called from `parse_day_response`) only counts towards the
+    nested phase. HTTP time is summed across all threads making requests.
+    """
+
+    def __init__(self, stack_sampler: StackSampler | None = None) -> None:
+        """Initialise the profiler.
+
+        Args:
+            stack_sampler: Sampler to write stacks from for each stream, if any.
+        """
+        self.stack_sampler = stack_sampler
+        self.seconds: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self.calls: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # names of the streams being timed, innermost last, for each thread
+        self._active_streams: dict[int, list[str]] = {}
+
+    def start(self) -> None:
+        """Start sampling stacks, if enabled."""
+        if self.stack_sampler:
+            self.stack_sampler.start(self._active_stream)
+
+    def stop(self) -> None:
+        """Stop sampling stacks, if enabled."""
+        if self.stack_sampler:
+            self.stack_sampler.stop()
+
+    @contextmanager
+    def timer(self, stream_name: str, phase: str) -> Iterator[None]:
+        """Time a phase for a stream.
+
+        Args:
+            stream_name: Name of the stream.
+            phase: Name of the phase.
+
+        Yields:
+            Nothing.
+        """
+        # time spent in nested timers, for each timer running in this thread
+        nested = self._local.__dict__.setdefault("nested", [])
+        nested.append(0.0)
+        streams = self._active_streams.setdefault(threading.get_ident(), [])
+        streams.append(stream_name)
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            streams.pop()
+            exclusive = elapsed - nested.pop()
+
+            if nested:
+                nested[-1] += elapsed
+
+            with self._lock:
+                self.seconds[stream_name][phase] += exclusive
+
+    def count(self, stream_name: str, phase: str) -> None:
+        """Count a call made in a phase for a stream.
+
+        Args:
+            stream_name: Name of the stream.
+            phase: Name of the phase.
+        """
+        with self._lock:
+            self.calls[stream_name][phase] += 1
+
+    def instrument_stream(self, stream: Stream) -> None:
+        """Time profiled methods of a stream, and log its profile with its costs.
+
+        Args:
+            stream: The stream to instrument.
+        """
+        for method_name, phase in PROFILED_METHODS.items():
+            method = getattr(stream, method_name, None)
+
+            if method is not None:
+                setattr(stream, method_name, self._wrap(method, stream.name, phase))
+
+        log_sync_costs = stream.log_sync_costs
+
+        @wraps(log_sync_costs)
+        def log_profile() -> None:
+            log_sync_costs()
+            self.log(stream)
+
+        stream.log_sync_costs = log_profile  # type: ignore[method-assign]
+
+    def log(self, stream: Stream) -> None:
+        """Log the profile of a stream, and write its sampled stacks.
+
+        Args:
+            stream: The stream to log the profile of.
+        """
+        with self._lock:
+            seconds = self.seconds.pop(stream.name, Counter())
+            calls = self.calls.pop(stream.name, Counter())
+
+        if seconds:
+            stream.logger.info(
+                "Profile for stream %s: %s",
+                stream.name,
+                ", ".join(
+                    f"{phase} {s:.3f}s ({calls[phase]} calls)"
+                    for phase, s in seconds.most_common()
+                ),
+            )
+
+        if self.stack_sampler and (
+            path := self.stack_sampler.write(stream.name, PROFILE_OUTPUT_DIR)
+        ):
+            stream.logger.info("Wrote sampled stacks for stream to %s", path)
+
+    def _active_stream(self, thread_id: int) -> str | None:
+        try:
+            return self._active_streams[thread_id][-1]
+        except (KeyError, IndexError):
+            return None
+
+    def _wrap(self, method, stream_name: str, phase: str):
+        if inspect.isgeneratorfunction(method):
+
+            @wraps(method)
+            def timed_generator(*args, **kwargs):
+                self.count(stream_name, phase)
+                iterator = method(*args, **kwargs)
+
+                # only time spent producing values, not consuming them
+                while True:
+                    with self.timer(stream_name, phase):
+                        try:
+                            value = next(iterator)
+                        except StopIteration:
+                            return
+
+                    yield value
+
+            return timed_generator
+
+        @wraps(method)
+        def timed_method(*args, **kwargs):
+            self.count(stream_name, phase)
+
+            with self.timer(stream_name, phase):
+                return method(*args, **kwargs)
+
+        return timed_method
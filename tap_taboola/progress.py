@@ -0,0 +1,124 @@
+"""Report progress tracking for tap-taboola."""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class ReportProgress:
+    """Track completed report days for a single account.
+
+    Days may be completed in any order and from any thread. The bookmark is always
+    the first day that has not been completed, so a restart resumes exactly where
+    contiguous progress ended. Days completed beyond the bookmark are kept as
+    ranges and skipped when resuming.
+    """
+
+    def __init__(
+        self,
+        start_date: date,
+        completed_ranges: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        """Initialise the tracker.
+
+        Args:
+            start_date: First day to extract.
+            completed_ranges: Inclusive ISO date ranges already completed after
+                ``start_date``.
+        """
+        self._lock = threading.Lock()
+        self._frontier = start_date
+        self._completed: set[date] = set()
+
+        for start, end in completed_ranges:
+            day = date.fromisoformat(start)
+            end_day = date.fromisoformat(end)
+
+            while day <= end_day:
+                if day >= start_date:
+                    self._completed.add(day)
+
+                day += timedelta(days=1)
+
+        self._advance()
+
+    @property
+    def bookmark(self) -> date:
+        """First day which has not been completed."""
+        with self._lock:
+            return self._frontier
+
+    def is_complete(self, day: date) -> bool:
+        """Check if a day has been completed.
+
+        Args:
+            day: The day to check.
+
+        Returns:
+            Whether the day has been completed.
+        """
+        with self._lock:
+            return day < self._frontier or day in self._completed
+
+    def mark_complete(self, day: date) -> None:
+        """Record a day as completed.
+
+        Args:
+            day: The completed day.
+        """
+        with self._lock:
+            if day < self._frontier:
+                return
+
+            self._completed.add(day)
+            self._advance()
+
+    def pending_days(self, end_date: date) -> Iterator[date]:
+        """Iterate over days that have not been completed.
+
+        Args:
+            end_date: Last day to include.
+
+        Yields:
+            Each pending day, in order.
+        """
+        day = self.bookmark
+
+        while day <= end_date:
+            if not self.is_complete(day):
+                yield day
+
+            day += timedelta(days=1)
+
+    def completed_ranges(self) -> list[tuple[str, str]]:
+        """Return days completed beyond the bookmark as inclusive ISO date ranges."""
+        with self._lock:
+            days = sorted(self._completed)
+
+        ranges: list[tuple[str, str]] = []
+        start = end = None
+
+        for day in days:
+            if end is not None and day == end + timedelta(days=1):
+                end = day
+                continue
+
+            if start is not None and end is not None:
+                ranges.append((start.isoformat(), end.isoformat()))
+
+            start = end = day
+
+        if start is not None and end is not None:
+            ranges.append((start.isoformat(), end.isoformat()))
+
+        return ranges
+
+    def _advance(self) -> None:
+        while self._frontier in self._completed:
+            self._completed.remove(self._frontier)
+            self._frontier += timedelta(days=1)
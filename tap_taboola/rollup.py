@@ -0,0 +1,100 @@
+"""Streaming report rollups for tap-taboola."""
+
+from __future__ import annotations
+
+import decimal
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+
+SUMMED_METRICS = (
+    "clicks",
+    "impressions",
+    "visible_impressions",
+    "spent",
+    "conversions_value",
+    "cpa_actions_num",
+)
+
+
+def _ratio(numerator, denominator, scale: int = 1) -> decimal.Decimal | None:
+    # ratios are computed in `Decimal`, so they are as exact as the metrics they are
+    # computed from
+    if not denominator:
+        return None
+
+    return decimal.Decimal(numerator) * scale / denominator
+
+
+class Rollup:
+    """Aggregate report rows into totals per group, one window at a time.
+
+    Only running totals are kept for each group, so memory is bounded by the number
+    of groups in the windows that are still open rather than the number of rows.
+    """
+
+    def __init__(self, group_by: Sequence[str]) -> None:
+        """Initialise the rollup.
+
+        Args:
+            group_by: Row properties to group by. The first row seen for a group
+                provides their values.
+        """
+        self.group_by = tuple(group_by)
+        self._lock = threading.Lock()
+        self._windows: dict[Hashable, dict[tuple, dict]] = {}
+
+    def add(self, window: Hashable, row: dict) -> None:
+        """Add a row to the totals for its group.
+
+        Args:
+            window: The window the row belongs to.
+            row: The report row.
+        """
+        key = tuple(row.get(p) for p in self.group_by)
+
+        with self._lock:
+            groups = self._windows.setdefault(window, {})
+            totals = groups.get(key)
+
+            if totals is None:
+                totals = groups[key] = dict(zip(self.group_by, key))
+                totals["currency"] = row.get("currency")
+                totals.update(dict.fromkeys(SUMMED_METRICS, 0))
+
+            for metric in SUMMED_METRICS:
+                totals[metric] += row.get(metric) or 0
+
+    def pop(self, window: Hashable) -> list[dict]:
+        """Remove a window and return its totals, with ratios recomputed.
+
+        Args:
+            window: The window to remove.
+
+        Returns:
+            A row of totals for each group in the window.
+        """
+        with self._lock:
+            groups = self._windows.pop(window, {})
+
+        rows = list(groups.values())
+
+        for row in rows:
+            clicks = row["clicks"]
+            impressions = row["impressions"]
+            visible_impressions = row["visible_impressions"]
+            spent = row["spent"]
+            actions = row["cpa_actions_num"]
+
+            row["ctr"] = _ratio(clicks, impressions, 100)
+            row["vctr"] = _ratio(clicks, visible_impressions, 100)
+            row["cpc"] = _ratio(spent, clicks)
+            row["cpm"] = _ratio(spent, impressions, 1000)
+            row["vcpm"] = _ratio(spent, visible_impressions, 1000)
+            row["cpa"] = _ratio(spent, actions)
+            row["cpa_conversion_rate"] = _ratio(actions, clicks, 100)
+            row["roas"] = _ratio(row["conversions_value"], spent)
+
+        return rows
@@ -0,0 +1,185 @@
+"""Request scheduling for tap-taboola."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+
+
+def iter_completed(
+    requests: Iterable[tuple[_K, Callable[[], _T]]],
+    max_workers: int,
+) -> Iterator[tuple[_K, _T]]:
+    """Make requests over a bounded thread pool, in the order they complete.
+
+    At most ``max_workers`` requests are in flight at any time, so requests are only
+    made as results are consumed.
+
+    Args:
+        requests: Pairs of request key and function making the request.
+        max_workers: Maximum number of requests to make concurrently.
+
+    Yields:
+        Pairs of request key and result, as each request completes.
+    """
+    requests = iter(requests)
+    pending: dict[Future[_T], _K] = {}
+
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="tap-taboola") as executor:
+        while True:
+            for key, request in islice(requests, max_workers - len(pending)):
+                pending[executor.submit(request)] = key
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                yield pending.pop(future), future.result()
+
+
+class RateLimiter:
+    """Limit the rate requests are made at, across all threads."""
+
+    def __init__(self, max_requests_per_second: float | None) -> None:
+        """Initialise the rate limiter.
+
+        Args:
+            max_requests_per_second: Maximum number of requests per second, or
+                ``None`` for no limit.
+        """
+        self._interval = (
+            1 / max_requests_per_second if max_requests_per_second else None
+        )
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self) -> None:
+        """Wait until a request is allowed to be made."""
+        if self._interval is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RequestScheduler(Generic[_T]):
+    """Prefetch planned requests over a bounded thread pool.
+
+    Requests are planned ahead in the order they will be consumed, and at most
+    ``lookahead`` are in flight or waiting to be consumed at any time. Requests that
+    are consumed before they have been submitted are made directly.
+    """
+
+    def __init__(self, max_workers: int, lookahead: int | None = None) -> None:
+        """Initialise the scheduler.
+
+        Args:
+            max_workers: Maximum number of requests to make concurrently.
+            lookahead: Maximum number of requests to prefetch. Defaults to twice
+                ``max_workers``.
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers,
+            thread_name_prefix="tap-taboola",
+        )
+        self._lookahead = lookahead or max_workers * 2
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._plans: set[Hashable] = set()
+        self._queue: deque[tuple[Hashable, Callable[[], _T]]] = deque()
+        self._futures: dict[Hashable, Future[_T]] = {}
+
+    def plan(
+        self,
+        plan_key: Hashable,
+        requests: Iterable[tuple[Hashable, Callable[[], _T]]],
+    ) -> None:
+        """Plan requests to be prefetched, unless already planned.
+
+        Args:
+            plan_key: Key identifying the plan.
+            requests: Pairs of request key and function making the request, in the
+                order they will be consumed.
+        """
+        with self._lock:
+            if self._stopped or plan_key in self._plans:
+                return
+
+            self._plans.add(plan_key)
+            self._queue.extend(requests)
+            self._fill()
+
+    def result(self, key: Hashable, request: Callable[[], _T]) -> _T:
+        """Get the result of a request.
+
+        Args:
+            key: Key identifying the request.
+            request: Function making the request, if it was not planned.
+
+        Returns:
+            The request result.
+        """
+        with self._lock:
+            future = self._futures.pop(key, None)
+
+            if future is None:
+                self._queue = deque(r for r in self._queue if r[0] != key)
+
+            self._fill()
+
+        if future is None:
+            return request()
+
+        return future.result()
+
+    def is_submitted(self, key: Hashable) -> bool:
+        """Check if a request has been submitted and not yet consumed.
+
+        Args:
+            key: Key identifying the request.
+
+        Returns:
+            ``True`` if the request is in flight or its result is waiting to be
+            consumed.
+        """
+        with self._lock:
+            return key in self._futures
+
+    def stop(self) -> None:
+        """Stop submitting planned requests.
+
+        Requests already submitted still complete, and their results can still be
+        consumed.
+        """
+        with self._lock:
+            self._stopped = True
+            self._queue.clear()
+
+    def shutdown(self) -> None:
+        """Cancel planned requests and wait for in-flight requests to finish."""
+        with self._lock:
+            self._queue.clear()
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fill(self) -> None:
+        while self._queue and len(self._futures) < self._lookahead:
+            key, request = self._queue.popleft()
+            self._futures[key] = self._executor.submit(request)
@@ -0,0 +1,99 @@
+"""HTTP session handling for tap-taboola."""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class _ByteCounter:
+    """File wrapper counting the bytes read through it."""
+
+    def __init__(self, fp) -> None:
+        self.bytes_read = 0
+        self._fp = fp
+
+    def read(self, *args) -> bytes:
+        data = self._fp.read(*args)
+        self.bytes_read += len(data)
+        return data
+
+    def read1(self, *args) -> bytes:
+        data = self._fp.read1(*args)
+        self.bytes_read += len(data)
+        return data
+
+    def readline(self, *args) -> bytes:
+        data = self._fp.readline(*args)
+        self.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        n = self._fp.readinto(buffer)
+        self.bytes_read += n or 0
+        return n
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._fp, name)
+
+
+def create_session(pool_size: int) -> requests.Session:
+    """Create a session to share between all streams.
+
+    Connections are pooled and kept alive, so TLS handshakes are only made when a new
+    connection is opened. The pool is thread-safe and blocks when all connections are
+    in use, rather than opening connections which are then discarded. Failed requests
+    are not retried by the session, only by the streams making them.
+
+    Responses are requested compressed with gzip or deflate, as requests does by
+    default, and bodies are decompressed chunk by chunk as they are read. The bytes
+    of each body read from the connection are counted, see `wire_bytes`.
+
+    Args:
+        pool_size: Maximum number of connections to keep open per host.
+
+    Returns:
+        A new session.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=True,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.hooks["response"].append(_count_wire_bytes)
+
+    return session
+
+
+def wire_bytes(response: requests.Response) -> int | None:
+    """Return the number of bytes of a response body read from the connection.
+
+    This is the size of the body as sent, before it is decompressed, and includes
+    the framing of chunked bodies.
+
+    Args:
+        response: A response whose content has been read.
+
+    Returns:
+        The number of bytes, or ``None`` if they were not counted.
+    """
+    counter = getattr(response, "wire_byte_counter", None)
+    return counter.bytes_read if isinstance(counter, _ByteCounter) else None
+
+
+def _count_wire_bytes(response: requests.Response, *args, **kwargs):  # noqa: ARG001
+    # urllib3 only counts the bytes of bodies sent with a content length, so count
+    # reads from the connection file under both urllib3 and http.client instead.
+    # The file is released once the body is read, so keep the counter on the response
+    original_response = getattr(response.raw, "_fp", None)
+
+    if getattr(original_response, "fp", None) is not None:
+        counter = _ByteCounter(original_response.fp)  # type: ignore[union-attr]
+        original_response.fp = counter  # type: ignore[union-attr]
+        response.wire_byte_counter = counter  # type: ignore[attr-defined]
+
+    return response
@@ -2,19 +2,35 @@
 
 from __future__ import annotations
 
+import decimal
+import json
+from collections import deque
+from datetime import datetime, timezone
+from functools import cached_property, partial
 from http import HTTPStatus
-from typing import TYPE_CHECKING
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+from uuid import uuid4
 
+from singer_sdk import Stream, metrics
 from singer_sdk import typing as th  # JSON Schema typing helpers
 from typing_extensions import override
 
+from tap_taboola.cache import RecordCache, RecordHashIndex
 from tap_taboola.client import TaboolaStream
+from tap_taboola.dedup import SeenKeyIndex
 from tap_taboola.pagination import DayPaginator
+from tap_taboola.progress import ReportProgress
+from tap_taboola.rollup import SUMMED_METRICS, Rollup
+from tap_taboola.scheduler import iter_completed
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import date
 
     import requests
+    from singer_sdk.helpers.types import Context
 
 TargetingType = th.PropertiesList(
     th.Property("type", th.StringType),
@@ -44,7 +60,213 @@ class _ResumableAPIError(Exception):
         self.response = response
 
 
-class AccountStream(TaboolaStream):
+class _FullTableStream(TaboolaStream):
+    """Base class for full-table streams.
+
+    With `suppress_unchanged_records`, a hash of each record emitted is kept in
+    `cache_dir` by partition, so records are only emitted again once they change.
+    Each run saves the index to a new file named in the final state, so an index is
+    only used once the state emitted with it has been committed.
+    """
+
+    # defined by each stream, and extended for tombstones
+    schema: dict
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the stream."""
+        super().__init__(*args, **kwargs)
+        self._suppressed_records = 0
+        self._deleted_records = 0
+
+        if self._emit_tombstones:
+            self.schema = {
+                **self.schema,
+                "properties": {
+                    **self.schema["properties"],
+                    "_sdc_deleted_at": th.DateTimeType().type_dict,
+                },
+            }
+
+    @cached_property
+    def record_hashes(self) -> RecordHashIndex | None:
+        """Return the index of hashes of records emitted, if enabled.
+
+        Returns:
+            A record hash index instance, or ``None`` if the stream is not selected
+            or `suppress_unchanged_records` is not enabled.
+        """
+        if not self.selected or not self.config.get("suppress_unchanged_records"):
+            return None
+
+        if not self.config.get("cache_dir"):
+            self.logger.warning(
+                "Not suppressing unchanged records, as `cache_dir` is not set"
+            )
+            return None
+
+        # without a version in state, no index has been committed with the records
+        # it was built from
+        version = self.stream_state.get("record_hashes_version")
+        return RecordHashIndex(
+            self._get_record_hashes_path(version) if version else None
+        )
+
+    @override
+    def get_records(self, context):
+        child_streams = self._indexed_child_streams
+
+        if self.record_hashes is None and not child_streams:
+            yield from super().get_records(context)
+            return
+
+        partition = self._get_partition_key(context)
+        child_partitions = set()
+
+        for record in super().get_records(context):
+            if self.record_hashes is not None:
+                self.record_hashes.mark_seen(partition, self._get_record_key(record))
+
+            child_context = self.get_child_context(record, context)
+            child_partitions.add(self._get_partition_key(child_context))
+            yield record
+
+        # only reached if every record of the partition was listed successfully
+        if self.record_hashes is not None:
+            self.record_hashes.mark_listed(partition)
+
+        for child_stream in child_streams:
+            child_stream._mark_orphaned_partitions(context, child_partitions)  # noqa: SLF001
+
+    @override
+    def _write_record_message(self, record):
+        if self.record_hashes is not None and not self.record_hashes.update(
+            self._get_partition_key(self.context),
+            self._get_record_key(record),
+            record,
+        ):
+            self._suppressed_records += 1
+            return
+
+        super()._write_record_message(record)
+
+    @override
+    def finalize_state_progress_markers(self, state=None):
+        # child streams are not finalized when their parent stream is deselected, so
+        # save indexes for all full-table streams from the top-level stream, before
+        # the final state naming them is written
+        if self.parent_stream_type is None and state is None:
+            self._save_record_hashes()
+            self._is_state_flushed = False
+
+        super().finalize_state_progress_markers(state)
+
+        # not written above if this stream is deselected
+        self._write_state_message()
+
+    @property
+    def _emit_tombstones(self) -> bool:
+        return bool(
+            self.config.get("suppress_unchanged_records")
+            and self.config.get("emit_tombstones")
+        )
+
+    @property
+    def _indexed_child_streams(self) -> list[_FullTableStream]:
+        return [
+            child_stream
+            for child_stream in self.child_streams
+            if isinstance(child_stream, _FullTableStream)
+            and child_stream.record_hashes is not None
+        ]
+
+    def _get_partition_key(self, context: Context | None) -> str:
+        return json.dumps(dict(context or {}), sort_keys=True, default=str)
+
+    def _get_record_key(self, record: dict) -> str:
+        return json.dumps([record.get(k) for k in self.primary_keys], default=str)
+
+    def _get_record_hashes_path(self, version: str) -> Path:
+        return (
+            Path(self.config["cache_dir"])
+            / f"record-hashes-{self.config['client_id']}-{self.name}-{version}.json"
+        )
+
+    def _mark_orphaned_partitions(
+        self,
+        parent_context: Context | None,
+        partitions: set[str],
+    ) -> None:
+        # partitions under a listed parent partition which were not listed this time
+        # belong to parent records that no longer exist, as do their own children
+        parent_items = dict(parent_context or {}).items()
+        record_hashes = self.record_hashes
+
+        if record_hashes is None:
+            return
+
+        for partition in record_hashes.partitions:
+            if partition in partitions:
+                continue
+
+            context = json.loads(partition)
+
+            if context.items() >= parent_items:
+                # none of its records are seen, so they are all deleted
+                record_hashes.mark_listed(partition)
+
+                for child_stream in self._indexed_child_streams:
+                    child_stream._mark_orphaned_partitions(context, set())  # noqa: SLF001
+
+    def _write_tombstones(self, deleted: list[tuple[str, str]]) -> None:
+        deleted_at = datetime.now(tz=timezone.utc).isoformat()
+
+        for partition, key in deleted:
+            tombstone = json.loads(partition)
+            tombstone.update(zip(self.primary_keys, json.loads(key)))
+            tombstone["_sdc_deleted_at"] = deleted_at
+
+            # bypass change suppression, which would index the tombstone
+            super()._write_record_message(tombstone)
+
+        self._deleted_records += len(deleted)
+
+    def _save_record_hashes(self) -> None:
+        if self.record_hashes is not None:
+            deleted = self.record_hashes.pop_deleted()
+
+            if self._emit_tombstones:
+                self._write_tombstones(deleted)
+
+            previous_version = self.stream_state.get("record_hashes_version")
+            version = uuid4().hex
+            self.record_hashes.save(self._get_record_hashes_path(version))
+            self.stream_state["record_hashes_version"] = version
+
+            # keep the index named in the incoming state until the target commits the
+            # state naming the new one
+            kept_paths = {
+                self._get_record_hashes_path(v)
+                for v in (previous_version, version)
+                if v
+            }
+            pattern = self._get_record_hashes_path("*")
+
+            for path in pattern.parent.glob(pattern.name):
+                if path not in kept_paths:
+                    path.unlink(missing_ok=True)
+
+            self.logger.info(
+                "Suppressed %d unchanged records, and emitted %d deleted records",
+                self._suppressed_records,
+                self._deleted_records,
+            )
+
+        for child_stream in self.child_streams:
+            if isinstance(child_stream, _FullTableStream):
+                child_stream._save_record_hashes()  # noqa: SLF001
+
+
+class AccountStream(_FullTableStream):
     """Define accounts stream."""
 
     name = "accounts"
@@ -75,9 +297,40 @@ class AccountStream(TaboolaStream):
         ),
     ).to_dict()
 
+    @cached_property
+    def account_cache(self) -> RecordCache | None:
+        """Return the account cache, if enabled.
+
+        Returns:
+            A record cache instance, or ``None`` if `cache_dir` is not configured.
+        """
+        cache_dir = self.config.get("cache_dir")
+
+        if not cache_dir:
+            return None
+
+        return RecordCache(
+            Path(cache_dir) / f"accounts-{self.config['client_id']}.json",
+            ttl=self.config["account_cache_ttl"],
+        )
+
     @override
     def get_records(self, context):
-        records = super().get_records(context)
+        # every other stream is synced while accounts are read, so what they share is
+        # set up and torn down around them
+        self._tap.begin_sync()
+
+        try:
+            for record in self._get_selected_account_records(context):
+                # keep consuming accounts after the maximum runtime is reached, so the
+                # account cache is still saved
+                if not self._tap.max_runtime_reached:
+                    yield record
+        finally:
+            self._tap.end_sync()
+
+    def _get_selected_account_records(self, context: Context | None) -> Iterable[dict]:
+        records = self._get_account_records(context)
 
         account_ids = set(self.config["account_ids"])
 
@@ -108,8 +361,39 @@ class AccountStream(TaboolaStream):
     def get_child_context(self, record, context):
         return {"account_id": record["account_id"]}
 
+    def _get_account_records(self, context: Context | None) -> Iterable[dict]:
+        request_accounts = super().get_records
+
+        if not self.account_cache:
+            yield from request_accounts(context)
+            return
+
+        cached = self.account_cache.load()
+
+        if cached is not None and not cached.expired:
+            cached_account_ids = {record["account_id"] for record in cached.records}
 
-class CampaignStream(TaboolaStream):
+            # accounts granted since the listing was cached are only found by
+            # requesting it again
+            if cached_account_ids.issuperset(self.config["account_ids"]):
+                self.logger.info(
+                    "Using cached accounts from %s", self.account_cache.path
+                )
+                yield from cached.records
+                return
+
+            self.logger.info("Cached accounts do not include all `account_ids`")
+
+        accounts = []
+
+        for record in request_accounts(context):
+            accounts.append(record)
+            yield record
+
+        self.account_cache.save(accounts)
+
+
+class CampaignStream(_FullTableStream):
     """Define campaigns stream."""
 
     parent_stream_type = AccountStream
@@ -321,10 +605,53 @@ class CampaignStream(TaboolaStream):
     @override
     def get_records(self, context):
         try:
-            yield from super().get_records(context)
+            records = super().get_records(context)
+
+            if self._campaign_item_stream.selected:
+                records = self._prefetch_campaign_items(context, records)
+
+            yield from records
         except _ResumableAPIError as e:
             self.logger.warning(e)
 
+    @cached_property
+    def _campaign_item_stream(self) -> CampaignItemStream:
+        return cast("CampaignItemStream", self._tap.streams[CampaignItemStream.name])
+
+    def _prefetch_campaign_items(self, context: Context, records: Iterable[dict]):
+        # request items for campaigns concurrently, and yield each campaign as soon
+        # as its items are ready so the items are synced with the campaign context
+        item_stream = self._campaign_item_stream
+        records = list(records)
+
+        requests = (
+            (
+                i,
+                partial(
+                    item_stream._request_campaign_items,  # noqa: SLF001
+                    self.get_child_context(record, context),
+                ),
+            )
+            for i, record in enumerate(records)
+        )
+
+        for i, response in iter_completed(
+            requests,
+            self.config["campaign_item_concurrency"],
+        ):
+            record = records[i]
+            item_stream.prefetched_responses[record["id"]] = response
+
+            try:
+                yield record
+            finally:
+                # release the response if the items were not synced, such as when the
+                # campaign is filtered out by a stream map
+                unused = item_stream.prefetched_responses.pop(record["id"], None)
+
+                if unused is not None:
+                    unused.close()
+
     @override
     def validate_response(self, response):
         if response.status_code == HTTPStatus.NOT_FOUND:
@@ -338,7 +665,7 @@ class CampaignStream(TaboolaStream):
         return context | {"campaign_id": record["id"]}
 
 
-class CampaignItemStream(TaboolaStream):
+class CampaignItemStream(_FullTableStream):
     """Define campaign items stream."""
 
     parent_stream_type = CampaignStream
@@ -514,20 +841,389 @@ class CampaignItemStream(TaboolaStream):
         ),
     ).to_dict()
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the stream."""
+        super().__init__(*args, **kwargs)
+        self.prefetched_responses: dict[str, requests.Response] = {}
 
-class CampaignSummarySiteDailyReport(TaboolaStream):
-    """Define campaign summary site daily report stream."""
+    @override
+    def request_records(self, context):
+        response = self.prefetched_responses.pop(context["campaign_id"], None)
+
+        if response is None:
+            yield from super().request_records(context)
+            return
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+            request_counter.increment()
+            self.update_sync_costs(response.request, response, context)
+
+            yield from self.parse_response(response)
+
+    def _request_campaign_items(self, context: Context) -> requests.Response:
+        prepared_request = self.prepare_request(context, next_page_token=None)
+        return self.request_decorator(self._request)(prepared_request, context)
+
+
+class _JSONFloat(str):
+    """A float from JSON, kept as text until it is known to be needed."""
+
+    __slots__ = ()
+
+
+class _DailyReportStream(TaboolaStream):
+    """Base class for daily report streams.
+
+    Each day is requested separately. Completed days are tracked per account with a
+    `ReportProgress`, so state always bookmarks the first unfinished day.
+    """
+
+    # emit a state message after this many days are completed for an account
+    PROGRESS_STATE_FREQUENCY = 7
 
     parent_stream_type = AccountStream
+    replication_key = "date"
+    is_timestamp_replication_key = True
+    is_sorted = True
+    selected_by_default = False
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the stream."""
+        super().__init__(*args, **kwargs)
+        self._progress: dict[str, ReportProgress] = {}
+        self._completed_days = 0
+        self._dropped_values = 0
+        self._seen_keys = (
+            SeenKeyIndex() if self.config.get("deduplicate_report_rows") else None
+        )
+
+    @override
+    def get_new_paginator(self):
+        progress = self._get_progress(self.context)
+        return DayPaginator(progress.bookmark, progress)
+
+    @override
+    def get_url_params(self, context, next_page_token: date):
+        return {
+            "start_date": next_page_token.isoformat(),
+            "end_date": next_page_token.isoformat(),
+        }
+
+    @override
+    def request_records(self, context):
+        paginator = self.get_new_paginator()
+        scheduler = self._tap.report_scheduler
+        scheduler.plan(context["account_id"], self._plan_requests(context))
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+
+            while not paginator.finished:
+                day = paginator.current_value
+                key = (self.name, context["account_id"], day)
+
+                if self._tap.max_runtime_reached:
+                    # stop at the first day not already requested, so no requests
+                    # are wasted
+                    scheduler.stop()
+
+                    if not scheduler.is_submitted(key):
+                        break
+
+                resp = scheduler.result(key, partial(self._request_day, context, day))
+                request_counter.increment()
+                self.update_sync_costs(resp.request, resp, context)
+
+                window = (context["account_id"], day.isoformat())
+                records = self.parse_day_response(resp, day)
+
+                if self._seen_keys is not None:
+                    records = self._seen_keys.filter(
+                        window,
+                        records,
+                        key=itemgetter(*self.primary_keys),
+                    )
+
+                if self.rollups:
+                    records = self._add_to_rollups(window, records)
+
+                if self.selected:
+                    yield from records
+                else:
+                    # only syncing for rollups, so skip record processing entirely
+                    deque(records, maxlen=0)
+
+                if self._seen_keys is not None:
+                    self._seen_keys.evict(window)
+
+                if self.rollups:
+                    self._sync_children(dict(zip(("account_id", "date"), window)))
+
+                # all records for the day have been processed by this point
+                self._complete_day(context, day)
+                paginator.advance(resp)
+
+        self._log_dropped(context)
+
+    def _log_dropped(self, context: Context) -> None:
+        if self._seen_keys and self._seen_keys.dropped:
+            self.logger.info(
+                "Dropped %d duplicate records for context: %s",
+                self._seen_keys.dropped,
+                context,
+            )
+            self._seen_keys.dropped = 0
+
+        if self._dropped_values:
+            self.logger.info(
+                "Dropped %d values of deselected columns %s for context: %s",
+                self._dropped_values,
+                sorted(self.schema["properties"].keys() - set(self.columns)),
+                context,
+            )
+            self._dropped_values = 0
+
+    def _plan_requests(self, context: Context):
+        # plan requests for all selected report streams of the account together, in
+        # the order the streams are synced, so requests for the next stream are
+        # already in flight as this one finishes
+        parent_stream = self._tap.streams[self.parent_stream_type.name]
+        today = datetime.now(tz=timezone.utc).date()
+
+        for stream in parent_stream.child_streams:
+            if not isinstance(stream, _DailyReportStream):
+                continue
+
+            if not (stream.selected or stream.has_selected_descendents):
+                continue
+
+            progress = stream._get_progress(context)  # noqa: SLF001
+
+            for day in progress.pending_days(today):
+                yield (
+                    (stream.name, context["account_id"], day),
+                    partial(stream._request_day, context, day),  # noqa: SLF001
+                )
+
+    def _request_day(self, context: Context, day: date) -> requests.Response:
+        prepared_request = self.prepare_request(context, next_page_token=day)
+        return self.request_decorator(self._request)(prepared_request, context)
+
+    @override
+    def _request(self, prepared_request, context):
+        # report requests share a single rate budget across all report streams
+        self._tap.report_rate_limiter.acquire()
+        return super()._request(prepared_request, context)
+
+    def parse_day_response(self, response: requests.Response, day: date) -> list[dict]:
+        """Parse the report response for a single day.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+            day: The day the report was requested for.
+
+        Returns:
+            The records from the source, post-processed as a page.
+        """
+        # report rows are always at the top level of `results`, so take the whole page
+        # at once rather than extracting each row with `records_jsonpath`
+        if len(self.columns) == len(self.schema["properties"]):
+            rows = response.json(parse_float=decimal.Decimal).get("results") or []
+            return self.post_process_page(rows, day)
+
+        # the reporting API always returns every column, so drop deselected columns
+        # before any further processing, and only convert floats that are kept, to the
+        # same values as above
+        rows = response.json(parse_float=_JSONFloat).get("results") or []
+        columns = set(self.columns)
+        kept_rows = [
+            {
+                k: decimal.Decimal(v) if type(v) is _JSONFloat else v
+                for k, v in row.items()
+                if k in columns
+            }
+            for row in rows
+        ]
+        self._dropped_values += sum(map(len, rows)) - sum(map(len, kept_rows))
+
+        return self.post_process_page(kept_rows, day)
+
+    def post_process_page(
+        self,
+        rows: list[dict],
+        day: date,  # noqa: ARG002
+    ) -> list[dict]:
+        """Transform a page of report rows at once.
+
+        Report streams make all their transforms here instead of in `post_process`,
+        so they are made in bulk instead of with a method call for every row. The SDK
+        still calls `post_process` for every record it writes, but report streams
+        leave it as the inherited no-op, since skipping it would mean overriding how
+        the SDK syncs records.
+
+        Args:
+            rows: The page of report rows.
+            day: The day the report was requested for.
+
+        Returns:
+            The transformed rows.
+        """
+        for column in self._integer_columns:
+            # whole numbers are sometimes returned with a fractional part, so convert
+            # those, and leave any other values as they are returned
+            for row in rows:
+                value = row.get(column)
+
+                if (
+                    type(value) is decimal.Decimal
+                    and value == value.to_integral_value()
+                ):
+                    row[column] = int(value)
+
+        return rows
+
+    @cached_property
+    def columns(self) -> tuple[str, ...]:
+        """Return the report columns to keep from each row.
+
+        Returns:
+            Columns selected in the catalog, and columns needed for primary keys,
+            bookmarks and selected rollups, in schema order.
+        """
+        properties = self.schema["properties"]
+        needed = {*self.primary_keys, self.replication_key}
+
+        if self.selected:
+            needed.update(p for p in properties if self.mask.get(("properties", p)))
+
+        for child_stream in self._selected_rollup_streams:
+            needed.update(child_stream.group_by, SUMMED_METRICS, ("currency",))
+
+        return tuple(p for p in properties if p in needed)
+
+    @cached_property
+    def _integer_columns(self) -> list[str]:
+        return [
+            name
+            for name in self.columns
+            if "integer" in self.schema["properties"][name].get("type", ())
+        ]
+
+    @override
+    def generate_child_contexts(self, record, context):
+        # child streams are synced once all records for a day have been processed,
+        # rather than for each record
+        return iter(())
+
+    @cached_property
+    def rollups(self) -> dict[str, Rollup]:
+        """Return a rollup for each selected child stream.
+
+        Returns:
+            A mapping of child stream names to rollups.
+        """
+        return {
+            child_stream.name: Rollup(child_stream.group_by)
+            for child_stream in self._selected_rollup_streams
+        }
+
+    @property
+    def _selected_rollup_streams(self) -> list[_RollupStream]:
+        return [
+            child_stream
+            for child_stream in self.child_streams
+            if isinstance(child_stream, _RollupStream) and child_stream.selected
+        ]
+
+    def _add_to_rollups(self, window: tuple, records: Iterable[dict]):
+        rollups = self.rollups.values()
+
+        for record in records:
+            for rollup in rollups:
+                rollup.add(window, record)
+
+            yield record
+
+    @override
+    def _increment_stream_state(self, latest_record, *, context=None):
+        # bookmarks are managed by `ReportProgress` as days complete, rather than
+        # from individual records
+        self.get_context_state(context)
+
+    @override
+    def _finalize_state(self, state=None):
+        if state is not None and (context := state.get("context")):
+            # always update state for completed dates, even if no records were returned
+            self._write_progress(state, self._get_progress(context))
+
+            # rollup partitions are not finalized by the tap when this stream is
+            # deselected, so finalize them along with the partition they roll up
+            for child_stream in self._selected_rollup_streams:
+                child_state = child_stream.get_context_state(context)
+                child_stream._finalize_state(child_state)  # noqa: SLF001
+
+        return super()._finalize_state(state)
+
+    def _get_progress(self, context: Context) -> ReportProgress:
+        account_id = context["account_id"]
+
+        if account_id not in self._progress:
+            state = self.get_context_state(context)
+
+            if "starting_replication_value" not in state:
+                # progress is being planned before this stream has started syncing
+                # the partition
+                self._write_starting_replication_value(context)
+
+            start = self.get_starting_timestamp(context)
+
+            if start is None:
+                msg = "`start_date` must be set to sync report streams"
+                raise ValueError(msg)
+
+            self._progress[account_id] = ReportProgress(
+                start.date(),
+                state.get("completed_date_ranges", ()),
+            )
+
+        return self._progress[account_id]
+
+    def _complete_day(self, context: Context, day: date) -> None:
+        # the current day is still accumulating data, so is never considered complete
+        if day >= datetime.now(tz=timezone.utc).date():
+            return
+
+        progress = self._get_progress(context)
+        progress.mark_complete(day)
+
+        state = self.get_context_state(context)
+        self._write_progress(state, progress)
+
+        self._completed_days += 1
+
+        if self._completed_days % self.PROGRESS_STATE_FREQUENCY == 0:
+            self._is_state_flushed = False
+            self._write_state_message()
+
+    def _write_progress(self, state: dict, progress: ReportProgress) -> None:
+        state["replication_key"] = self.replication_key
+        state["replication_key_value"] = progress.bookmark.isoformat()
+
+        if completed_ranges := progress.completed_ranges():
+            state["completed_date_ranges"] = completed_ranges
+        else:
+            state.pop("completed_date_ranges", None)
+
+
+class CampaignSummarySiteDailyReport(_DailyReportStream):
+    """Define campaign summary site daily report stream."""
+
     name = "campaign_summary_site_daily_report"
     path = (
         "/{account_id}/reports/campaign-summary/dimensions/campaign_site_day_breakdown"
     )
     primary_keys = ("date", "site_id", "campaign")
-    replication_key = "date"
-    is_timestamp_replication_key = True
-    is_sorted = True
-    selected_by_default = False
 
     schema = th.PropertiesList(
         th.Property("date", th.DateTimeType),
@@ -560,49 +1256,25 @@ class CampaignSummarySiteDailyReport(TaboolaStream):
     ).to_dict()
 
     @override
-    def get_new_paginator(self):
-        start_date = self.get_starting_timestamp(self.context).date()
-        return DayPaginator(start_date)
+    def post_process_page(self, rows, day):
+        rows = super().post_process_page(rows, day)
 
-    @override
-    def get_url_params(self, context, next_page_token: date):
-        self._date = next_page_token
-
-        return {
-            "start_date": next_page_token.isoformat(),
-            "end_date": next_page_token.isoformat(),
-        }
-
-    @override
-    def post_process(self, row, context=None):
-        date: str = row["date"]
-        row["date"] = date.removesuffix(".0")
+        # every row in a page has the same few distinct dates, so only normalise each
+        # of them once
+        dates = {d: d.removesuffix(".0") for d in {row["date"] for row in rows}}
 
-        return row
+        for row in rows:
+            row["date"] = dates[row["date"]]
 
-    @override
-    def _finalize_state(self, state=None):
-        if state is not None:
-            # always update state for the current date, even if no records were returned
-            state.setdefault("replication_key", self.replication_key)
-            state["replication_key_value"] = self._date.isoformat()
+        return rows
 
-        return super()._finalize_state(state)
 
-
-class TopCampaignContentDailyReportStream(TaboolaStream):
+class TopCampaignContentDailyReportStream(_DailyReportStream):
     """Define top campaign content daily report stream."""
 
-    _date: date
-
-    parent_stream_type = AccountStream
     name = "top_campaign_content_daily_report"
     path = "/{account_id}/reports/top-campaign-content/dimensions/item_breakdown"
     primary_keys = ("date", "item", "content_provider")
-    replication_key = "date"
-    is_timestamp_replication_key = True
-    is_sorted = True
-    selected_by_default = False
 
     schema = th.PropertiesList(
         th.Property("date", th.DateType),
@@ -645,39 +1317,114 @@ class TopCampaignContentDailyReportStream(TaboolaStream):
     ).to_dict()
 
     @override
-    def get_new_paginator(self):
-        start_date = self.get_starting_timestamp(self.context).date()
-        return DayPaginator(start_date)
+    def post_process_page(self, rows, day):
+        rows = super().post_process_page(rows, day)
+        valid_rows = [row for row in rows if row["item"] is not None]
 
-    @override
-    def get_url_params(self, context, next_page_token: date):
-        self._date = next_page_token
+        if len(valid_rows) < len(rows):
+            self.logger.warning(
+                "Ignoring %d invalid records with null `item` ID: %s",
+                len(rows) - len(valid_rows),
+                [row for row in rows if row["item"] is None],
+            )
 
-        return {
-            "start_date": next_page_token.isoformat(),
-            "end_date": next_page_token.isoformat(),
-        }
+        date = day.isoformat()
 
-    @override
-    def post_process(self, row, context=None):
-        if row["item"] is None:
-            self.logger.warning("Ignoring invalid record with null `item` ID: %s", row)
-            return None
+        for row in valid_rows:
+            row["date"] = date
+
+        return valid_rows
 
-        row["date"] = self._date.isoformat()
-        return row
+
+class _RollupStream(Stream):
+    """Base class for streams aggregated from campaign summary site daily report rows.
+
+    Rows are totalled as the parent report is read, so selecting a rollup stream does
+    not make any additional requests. Rollups are synced for each account once all
+    rows for a day have been processed.
+    """
+
+    group_by: tuple[str, ...]
+
+    parent_stream_type = CampaignSummarySiteDailyReport
+    state_partitioning_keys = ["account_id"]  # noqa: RUF012
+    replication_key = "date"
+    is_timestamp_replication_key = True
+    is_sorted = True
+    selected_by_default = False
 
     @override
-    def _finalize_state(self, state=None):
-        if state is not None:
-            # always update state for the current date, even if no records were returned
-            state.setdefault("replication_key", self.replication_key)
-            state["replication_key_value"] = self._date.isoformat()
+    def get_records(self, context):
+        parent_stream = self._tap.streams[self.parent_stream_type.name]
+        rollup = parent_stream.rollups[self.name]
 
-        return super()._finalize_state(state)
+        for row in rollup.pop((context["account_id"], context["date"])):
+            row["date"] = context["date"]
+            yield row
+
+
+RollupMetricsType = th.PropertiesList(
+    th.Property("clicks", th.IntegerType),
+    th.Property("impressions", th.IntegerType),
+    th.Property("visible_impressions", th.IntegerType),
+    th.Property("spent", th.NumberType),
+    th.Property("conversions_value", th.NumberType),
+    th.Property("cpa_actions_num", th.IntegerType),
+    th.Property("ctr", th.NumberType, description="Clicks per 100 impressions"),
+    th.Property(
+        "vctr",
+        th.NumberType,
+        description="Clicks per 100 visible impressions",
+    ),
+    th.Property("cpc", th.NumberType, description="Spend per click"),
+    th.Property("cpm", th.NumberType, description="Spend per 1000 impressions"),
+    th.Property(
+        "vcpm",
+        th.NumberType,
+        description="Spend per 1000 visible impressions",
+    ),
+    th.Property("cpa", th.NumberType, description="Spend per action"),
+    th.Property(
+        "cpa_conversion_rate",
+        th.NumberType,
+        description="Actions per 100 clicks",
+    ),
+    th.Property("roas", th.NumberType, description="Conversions value per spend"),
+    th.Property("currency", th.StringType),
+)
+
+
+class CampaignDailyRollupStream(_RollupStream):
+    """Define campaign daily rollup stream."""
+
+    name = "campaign_daily_rollup"
+    primary_keys = ("date", "campaign")
+    group_by = ("campaign", "campaign_name")
+
+    schema = th.PropertiesList(
+        th.Property("date", th.DateType),
+        th.Property("account_id", th.StringType),
+        th.Property("campaign", th.StringType),
+        th.Property("campaign_name", th.StringType),
+        *RollupMetricsType,
+    ).to_dict()
+
+
+class AccountDailyRollupStream(_RollupStream):
+    """Define account daily rollup stream."""
+
+    name = "account_daily_rollup"
+    primary_keys = ("date", "account_id")
+    group_by = ()
+
+    schema = th.PropertiesList(
+        th.Property("date", th.DateType),
+        th.Property("account_id", th.StringType),
+        *RollupMetricsType,
+    ).to_dict()
 
 
-class PublisherStream(TaboolaStream):
+class PublisherStream(_FullTableStream):
     """Define publishers stream."""
 
     parent_stream_type = AccountStream
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import time
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
 from typing_extensions import override
 
 from tap_taboola import streams
+from tap_taboola.auth import TaboolaAuthenticator
+from tap_taboola.mock import MockAPIAdapter
+from tap_taboola.profiling import Profiler, StackSampler
+from tap_taboola.scheduler import RateLimiter, RequestScheduler
+from tap_taboola.session import create_session
+
+if TYPE_CHECKING:
+    import requests
 
 STREAM_TYPES = [
     streams.AccountStream,
@@ -14,6 +26,8 @@ STREAM_TYPES = [
     streams.CampaignItemStream,
     streams.CampaignSummarySiteDailyReport,
     streams.TopCampaignContentDailyReportStream,
+    streams.CampaignDailyRollupStream,
+    streams.AccountDailyRollupStream,
     streams.PublisherStream,
 ]
 
@@ -52,11 +66,306 @@ class TapTaboola(Tap):
             title="Start Date",
             description="Initial date to start extracting data from",
         ),
+        th.Property(
+            "deduplicate_report_rows",
+            th.BooleanType,
+            title="Deduplicate Report Rows",
+            description=(
+                "Drop report rows with a primary key already emitted for the same"
+                " account and day"
+            ),
+            default=False,
+        ),
+        th.Property(
+            "cache_dir",
+            th.StringType,
+            title="Cache Directory",
+            description=(
+                "Directory to cache data between runs in, such as the accounts"
+                " available to the authenticated principal (disabled if not set)"
+            ),
+        ),
+        th.Property(
+            "account_cache_ttl",
+            th.IntegerType,
+            title="Account Cache TTL",
+            description=(
+                "Number of seconds cached accounts are used for before the listing is"
+                " requested again. The listing is also requested when cached accounts"
+                " do not include all `account_ids`."
+            ),
+            default=86400,
+        ),
+        th.Property(
+            "suppress_unchanged_records",
+            th.BooleanType,
+            title="Suppress Unchanged Records",
+            description=(
+                "Only emit records of full-table streams (accounts, campaigns,"
+                " campaign items and publishers) that are new or have changed since"
+                " the last run. Requires `cache_dir`, where a hash of each record"
+                " emitted is kept."
+            ),
+            default=False,
+        ),
+        th.Property(
+            "emit_tombstones",
+            th.BooleanType,
+            title="Emit Tombstones",
+            description=(
+                "When suppressing unchanged records, also emit a record with"
+                " `_sdc_deleted_at` set for each record that no longer exists,"
+                " including the campaigns and items of deleted accounts and campaigns"
+            ),
+            default=False,
+        ),
+        th.Property(
+            "report_concurrency",
+            th.IntegerType,
+            title="Report Concurrency",
+            description=(
+                "Maximum number of report requests to make concurrently, shared by"
+                " all report streams"
+            ),
+            default=4,
+        ),
+        th.Property(
+            "campaign_item_concurrency",
+            th.IntegerType,
+            title="Campaign Item Concurrency",
+            description=(
+                "Maximum number of campaigns of an account to request items for"
+                " concurrently"
+            ),
+            default=4,
+        ),
+        th.Property(
+            "http_pool_size",
+            th.IntegerType,
+            title="HTTP Pool Size",
+            description=(
+                "Maximum number of HTTP connections kept open to the Taboola API,"
+                " shared by all streams"
+            ),
+            default=10,
+        ),
+        th.Property(
+            "max_requests_per_second",
+            th.NumberType,
+            title="Max Requests Per Second",
+            description=(
+                "Maximum number of report requests to make per second, shared by all"
+                " report streams (unlimited if not set)"
+            ),
+        ),
+        th.Property(
+            "max_runtime",
+            th.IntegerType,
+            title="Max Runtime",
+            description=(
+                "Maximum number of seconds to request new accounts and report days"
+                " for. Once reached, requests already made are processed and the run"
+                " ends successfully with state for the work completed (unlimited if"
+                " not set)."
+            ),
+        ),
+        th.Property(
+            "profile",
+            th.BooleanType,
+            title="Profile",
+            description=(
+                "Time HTTP requests, response parsing, post-processing, type"
+                " conformance and message writing for each stream, and log the"
+                " breakdown at the end of the run"
+            ),
+            default=False,
+        ),
+        th.Property(
+            "profile_stacks",
+            th.BooleanType,
+            title="Profile Stacks",
+            description=(
+                "When profiling, also sample call stacks and write them for each"
+                " stream to the `output` directory, in the collapsed stack format read"
+                " by flamegraph tools"
+            ),
+            default=False,
+        ),
+        th.Property(
+            "mock_api",
+            th.ObjectType(
+                th.Property(
+                    "accounts",
+                    th.IntegerType,
+                    description="Number of accounts (default 3)",
+                ),
+                th.Property(
+                    "campaigns_per_account",
+                    th.IntegerType,
+                    description="Number of campaigns in each account (default 10)",
+                ),
+                th.Property(
+                    "items_per_campaign",
+                    th.IntegerType,
+                    description="Number of items in each campaign (default 5)",
+                ),
+                th.Property(
+                    "sites_per_campaign",
+                    th.IntegerType,
+                    description=(
+                        "Number of sites each campaign is reported for (default 10)"
+                    ),
+                ),
+                th.Property(
+                    "latency",
+                    th.NumberType,
+                    description="Number of seconds to wait before each response",
+                ),
+                th.Property(
+                    "rate_limit_rate",
+                    th.NumberType,
+                    description="Fraction of requests to answer with a 429 response",
+                ),
+                th.Property(
+                    "not_found_rate",
+                    th.NumberType,
+                    description=(
+                        "Fraction of accounts to answer campaign requests for with a"
+                        " 404 response"
+                    ),
+                ),
+                th.Property(
+                    "seed",
+                    th.IntegerType,
+                    description="Seed for the generated data and injected errors",
+                ),
+                th.Property(
+                    "chunked",
+                    th.BooleanType,
+                    description=(
+                        "Send response bodies with chunked transfer encoding instead"
+                        " of with a content length"
+                    ),
+                ),
+                additional_properties=False,
+            ),
+            title="Mock API",
+            description=(
+                "Serve synthetic data from a local stand-in for the Taboola API"
+                " instead of making requests, for testing the tap offline at scale"
+            ),
+        ),
     ).to_dict()
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the tap."""
+        self._started_at = time.monotonic()
+        self._max_runtime_logged = False
+        super().__init__(*args, **kwargs)
+
+    @property
+    def max_runtime_reached(self) -> bool:
+        """Check if the tap has run for longer than `max_runtime`.
+
+        Returns:
+            ``True`` if `max_runtime` is set and has been reached.
+        """
+        max_runtime = self.config.get("max_runtime")
+
+        if max_runtime is None or time.monotonic() - self._started_at < max_runtime:
+            return False
+
+        if not self._max_runtime_logged:
+            self._max_runtime_logged = True
+            self.logger.warning(
+                "Maximum runtime of %ds reached, finishing requests already made",
+                max_runtime,
+            )
+
+        return True
+
+    @cached_property
+    def requests_session(self) -> requests.Session:
+        """Return the HTTP session shared by all streams.
+
+        Returns:
+            A session instance.
+        """
+        session = create_session(pool_size=self.config["http_pool_size"])
+
+        if (mock_api := self.config.get("mock_api")) is not None:
+            self.logger.warning("Using mock API; no requests will be made to Taboola")
+            # unset options take their defaults
+            options = {k: v for k, v in mock_api.items() if v is not None}
+            session.mount("https://", MockAPIAdapter(**options))
+
+        return session
+
+    @cached_property
+    def report_scheduler(self) -> RequestScheduler:
+        """Return the scheduler shared by all report streams.
+
+        Returns:
+            A request scheduler instance.
+        """
+        return RequestScheduler(self.config["report_concurrency"])
+
+    @cached_property
+    def report_rate_limiter(self) -> RateLimiter:
+        """Return the rate limiter shared by all report streams.
+
+        Returns:
+            A rate limiter instance.
+        """
+        return RateLimiter(self.config.get("max_requests_per_second"))
+
+    @cached_property
+    def profiler(self) -> Profiler | None:
+        """Return the profiler, if enabled.
+
+        Returns:
+            A profiler instance, or ``None`` if `profile` is not enabled.
+        """
+        if not self.config.get("profile"):
+            return None
+
+        return Profiler(StackSampler() if self.config.get("profile_stacks") else None)
+
+    def begin_sync(self) -> None:
+        """Prepare what is shared by streams for a sync."""
+        if self.profiler:
+            self.profiler.start()
+
+    def end_sync(self) -> None:
+        """Clean up what is shared by streams once a sync ends, even if it fails."""
+        # only clean up what was created during the sync, and let the next sync
+        # create it again
+        if scheduler := self.__dict__.pop("report_scheduler", None):
+            scheduler.shutdown()
+
+        if self.profiler:
+            self.profiler.stop()
+
     @override
     def discover_streams(self):
-        return [stream_cls(tap=self) for stream_cls in STREAM_TYPES]
+        streams = [stream_cls(tap=self) for stream_cls in STREAM_TYPES]
+
+        # created up front, rather than by whichever thread first makes a request
+        # tokens are requested over a new connection, unless the mock API serves them
+        self.authenticator = TaboolaAuthenticator.create_for_stream(
+            streams[0],
+            session=(
+                self.requests_session
+                if self.config.get("mock_api") is not None
+                else None
+            ),
+        )
+
+        if self.profiler:
+            for stream in streams:
+                self.profiler.instrument_stream(stream)
+
+        return streams
 
 
 if __name__ == "__main__":
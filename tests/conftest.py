@@ -0,0 +1,48 @@
+"""Test fixtures for tap-taboola."""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from tap_taboola.tap import TapTaboola
+from tests.helpers import days_ago
+
+
+@pytest.fixture
+def make_tap():
+    """Return a function creating a tap syncing from the mock API."""
+
+    def make_tap(*streams, mock_api=None, state=None, **config):
+        tap = TapTaboola(
+            config={
+                "client_id": "mock",
+                "client_secret": "mock",
+                "start_date": days_ago(2),
+                "mock_api": mock_api or {},
+                **config,
+            },
+            state=state,
+        )
+
+        # select the given streams, or all streams if none are given
+        for stream in tap.streams.values():
+            stream.selected = not streams or stream.name in streams
+
+        return tap
+
+    return make_tap
+
+
+@pytest.fixture
+def sync(capsys):
+    """Return a function syncing a tap and returning the messages it wrote."""
+
+    def sync(tap):
+        tap.sync_all()
+        return [
+            json.loads(line, parse_float=Decimal)
+            for line in capsys.readouterr().out.splitlines()
+        ]
+
+    return sync
@@ -0,0 +1,17 @@
+"""Test helpers for tap-taboola."""
+
+from datetime import datetime, timedelta, timezone
+
+
+def days_ago(days: int) -> str:
+    """Return the ISO date a number of days before today."""
+    return (datetime.now(tz=timezone.utc).date() - timedelta(days=days)).isoformat()
+
+
+def records(messages, stream_name):
+    """Return the records written for a stream."""
+    return [
+        m["record"]
+        for m in messages
+        if m["type"] == "RECORD" and m["stream"] == stream_name
+    ]
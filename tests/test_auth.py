@@ -0,0 +1,69 @@
+"""Tests authentication and the shared HTTP session."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from singer_sdk import authenticators
+
+from tap_taboola.auth import TaboolaAuthenticator
+from tap_taboola.client import TaboolaStream
+
+
+class _TokenResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"access_token": "token", "expires_in": 3600}
+
+
+def _rest_streams(tap):
+    return [s for s in tap.streams.values() if isinstance(s, TaboolaStream)]
+
+
+def test_streams_share_the_tap_session_and_authenticator(make_tap):
+    tap = make_tap()
+    other_tap = make_tap()
+
+    assert {id(s.requests_session) for s in _rest_streams(tap)} == {
+        id(tap.requests_session)
+    }
+    assert {id(s.authenticator) for s in _rest_streams(tap)} == {id(tap.authenticator)}
+    assert other_tap.requests_session is not tap.requests_session
+    assert other_tap.authenticator is not tap.authenticator
+
+
+def test_token_is_refreshed_once_for_concurrent_requests(make_tap, monkeypatch):
+    calls = []
+    lock = threading.Lock()
+
+    def post(*args, **kwargs):
+        with lock:
+            calls.append(args)
+
+        time.sleep(0.05)  # let the other threads wait for the token
+        return _TokenResponse()
+
+    monkeypatch.setattr(authenticators.requests, "post", post)
+    authenticator = TaboolaAuthenticator.create_for_stream(_rest_streams(make_tap())[0])
+    request = requests.Request("GET", "https://example.com").prepare()
+
+    with ThreadPoolExecutor(8) as executor:
+        prepared = list(executor.map(lambda _: authenticator(request.copy()), range(8)))
+
+    assert len(calls) == 1
+    assert {r.headers["Authorization"] for r in prepared} == {"Bearer token"}
+
+
+def test_mock_api_serves_tokens_over_the_tap_session(make_tap, monkeypatch, sync):
+    def post(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(authenticators.requests, "post", post)
+    tap = make_tap("accounts")
+
+    assert sync(tap)
+    assert tap.authenticator.access_token == "mock"
+    assert authenticators.requests is requests
@@ -0,0 +1,123 @@
+"""Tests local caches."""
+
+import json
+import time
+
+from tap_taboola.cache import RecordCache, RecordHashIndex
+from tests.helpers import records
+
+
+def test_only_new_or_changed_records_are_updated(tmp_path):
+    index = RecordHashIndex(tmp_path / "hashes.json")
+
+    assert index.update("p", "1", {"id": 1, "name": "a"})
+    assert not index.update("p", "1", {"name": "a", "id": 1})
+    assert index.update("p", "1", {"id": 1, "name": "b"})
+    assert index.update("q", "1", {"id": 1, "name": "b"})
+
+
+def test_hashes_are_saved_between_runs(tmp_path):
+    index = RecordHashIndex(tmp_path / "hashes.json")
+    index.update("p", "1", {"id": 1})
+    index.save(tmp_path / "hashes.json")
+
+    assert not RecordHashIndex(tmp_path / "hashes.json").update("p", "1", {"id": 1})
+
+
+def test_unseen_records_of_listed_partitions_are_deleted(tmp_path):
+    index = RecordHashIndex(tmp_path / "hashes.json")
+
+    for partition in ("p", "q"):
+        index.update(partition, "1", {"id": 1})
+        index.update(partition, "2", {"id": 2})
+
+    index.mark_seen("p", "1")
+    index.mark_listed("p")
+    index.mark_seen("q", "1")
+
+    assert index.pop_deleted() == [("p", "2")]
+    assert index.pop_deleted() == []
+    assert index.update("p", "2", {"id": 2})
+    assert not index.update("q", "2", {"id": 2})
+
+
+def test_cached_records_expire(tmp_path):
+    path = tmp_path / "cache.json"
+    RecordCache(path, ttl=60).save([{"id": 1}])
+
+    assert RecordCache(path, ttl=60).load() == ([{"id": 1}], False)
+    assert RecordCache(path, ttl=-1).load() == ([{"id": 1}], True)
+
+
+def test_invalid_cache_is_ignored(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = RecordCache(path, ttl=60)
+
+    assert cache.load() is None
+
+    for content in (
+        "{",
+        "[]",
+        '{"records": []}',
+        '{"cached_at": "now", "records": []}',
+    ):
+        path.write_text(content)
+        assert cache.load() is None
+
+
+def _cache_accounts(cache_dir, records, *, cached_at):
+    path = cache_dir / "accounts-mock.json"
+    path.write_text(json.dumps({"cached_at": cached_at, "records": records}))
+    return path
+
+
+def _account(number, name):
+    return {"id": number, "account_id": f"mock-account-{number}", "name": name}
+
+
+def test_fresh_account_cache_is_used(make_tap, sync, tmp_path):
+    _cache_accounts(tmp_path, [_account(1, "Cached")], cached_at=time.time())
+    tap = make_tap("accounts", cache_dir=str(tmp_path))
+
+    assert [r["name"] for r in records(sync(tap), "accounts")] == ["Cached"]
+
+
+def test_account_cache_is_refreshed_for_missing_account_ids(make_tap, sync, tmp_path):
+    path = _cache_accounts(tmp_path, [_account(1, "Cached")], cached_at=time.time())
+    tap = make_tap(
+        "accounts",
+        cache_dir=str(tmp_path),
+        account_ids=["mock-account-1", "mock-account-2"],
+    )
+
+    assert [r["name"] for r in records(sync(tap), "accounts")] == [
+        "Mock Account 1",
+        "Mock Account 2",
+    ]
+    assert len(json.loads(path.read_text())["records"]) == 3
+
+
+def test_expired_account_cache_is_refreshed(make_tap, sync, tmp_path):
+    _cache_accounts(tmp_path, [_account(9, "Removed")], cached_at=0)
+    messages = sync(make_tap("accounts", "campaigns", cache_dir=str(tmp_path)))
+
+    assert [r["account_id"] for r in records(messages, "accounts")] == [
+        "mock-account-1",
+        "mock-account-2",
+        "mock-account-3",
+    ]
+    assert {r["advertiser_id"] for r in records(messages, "campaigns")} == {
+        "mock-account-1",
+        "mock-account-2",
+        "mock-account-3",
+    }
+
+
+def test_partitions_without_records_are_removed():
+    index = RecordHashIndex()
+    index.update("p", "1", {"id": 1})
+    index.update("q", "1", {"id": 1})
+    index.mark_listed("p")
+
+    assert index.pop_deleted() == [("p", "1")]
+    assert index.partitions == ["q"]
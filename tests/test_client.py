@@ -0,0 +1,49 @@
+"""Tests the base stream class."""
+
+import gzip
+
+import pytest
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_sync_costs_count_wire_and_decoded_bytes(make_tap, sync, chunked):
+    tap = make_tap("accounts", "campaigns", mock_api={"chunked": chunked})
+    stream = tap.streams["campaigns"]
+    calculate_sync_cost = stream.calculate_sync_cost
+    body_sizes = []
+
+    def record_body_sizes(request, response, context):
+        cost = calculate_sync_cost(request, response, context)
+        body_sizes.append(
+            (len(gzip.compress(response.content, mtime=0)), len(response.content))
+        )
+        return cost
+
+    stream.calculate_sync_cost = record_body_sizes
+    sync(tap)
+    costs = stream._sync_costs
+    compressed_bytes = sum(c for c, _ in body_sizes)
+
+    assert costs["requests"] == len(body_sizes) == 3
+    assert costs["decompressed_bytes"] == sum(d for _, d in body_sizes)
+
+    if chunked:
+        # each body is a single chunk, framed by its size and a final empty chunk
+        assert 0 < costs["compressed_bytes"] - compressed_bytes <= 3 * 16
+    else:
+        assert costs["compressed_bytes"] == compressed_bytes
+
+    assert costs["compressed_bytes"] < costs["decompressed_bytes"]
+
+
+def test_sync_costs_use_content_length_when_bytes_are_not_counted(make_tap, sync):
+    tap = make_tap("accounts")
+    tap.requests_session.hooks["response"].clear()
+    stream = tap.streams["accounts"]
+    sync(tap)
+
+    assert (
+        0
+        < stream._sync_costs["compressed_bytes"]
+        < stream._sync_costs["decompressed_bytes"]
+    )
@@ -0,0 +1,30 @@
+"""Tests report row deduplication."""
+
+from operator import itemgetter
+
+from tap_taboola.dedup import SeenKeyIndex
+
+ROWS = [
+    {"date": "2024-01-01", "site_id": 1, "campaign": "a", "clicks": 1},
+    {"date": "2024-01-01", "site_id": 2, "campaign": "a", "clicks": 2},
+    {"date": "2024-01-01", "site_id": 1, "campaign": "a", "clicks": 1},
+]
+
+key = itemgetter("date", "site_id", "campaign")
+
+
+def test_duplicates_are_dropped_within_window():
+    index = SeenKeyIndex()
+
+    assert list(index.filter("window", ROWS, key)) == ROWS[:2]
+    assert list(index.filter("window", ROWS, key)) == []
+    assert index.dropped == 4
+
+
+def test_evicted_window_is_forgotten():
+    index = SeenKeyIndex()
+
+    list(index.filter("window", ROWS, key))
+    index.evict("window")
+
+    assert list(index.filter("window", ROWS, key)) == ROWS[:2]
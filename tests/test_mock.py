@@ -0,0 +1,86 @@
+"""Tests syncing against the mock API."""
+
+from collections import Counter
+from http import HTTPStatus
+
+import pytest
+import requests
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_taboola.client import TaboolaStream
+from tap_taboola.mock import MockAPIAdapter
+from tap_taboola.tap import TapTaboola
+
+
+def _count_records(messages):
+    return Counter(m["stream"] for m in messages if m["type"] == "RECORD")
+
+
+def test_sync_all_streams(make_tap, sync):
+    tap = make_tap(
+        mock_api={
+            "accounts": 2,
+            "campaigns_per_account": 3,
+            "items_per_campaign": 2,
+            "sites_per_campaign": 4,
+        },
+    )
+
+    # 3 days for each account
+    assert _count_records(sync(tap)) == {
+        "accounts": 2,
+        "publishers": 2,
+        "campaigns": 2 * 3,
+        "campaign_items": 2 * 3 * 2,
+        "campaign_summary_site_daily_report": 3 * 2 * 3 * 4,
+        "top_campaign_content_daily_report": 3 * 2 * 3 * 2,
+        "campaign_daily_rollup": 3 * 2 * 3,
+        "account_daily_rollup": 3 * 2,
+    }
+
+
+def test_inaccessible_accounts_are_skipped(make_tap, sync):
+    records = _count_records(
+        sync(make_tap(mock_api={"accounts": 2, "not_found_rate": 1}))
+    )
+
+    assert records["accounts"] == 2
+    assert records["campaigns"] == 0
+
+
+def test_unknown_account_paths_are_not_found():
+    session = requests.Session()
+    session.mount("https://", MockAPIAdapter())
+
+    response = session.get(f"{TaboolaStream.url_base}/account-1/unknown")
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_tokens_are_not_rate_limited():
+    session = requests.Session()
+    session.mount("https://", MockAPIAdapter(rate_limit_rate=1))
+
+    response = session.post("https://backstage.taboola.com/backstage/oauth/token")
+
+    assert response.json()["access_token"] == "mock"
+
+
+def test_unset_mock_options_take_defaults(make_tap, sync):
+    tap = make_tap("accounts", mock_api={"accounts": None, "seed": None})
+
+    assert _count_records(sync(tap)) == {"accounts": 3}
+
+
+def test_unknown_mock_options_are_invalid(make_tap):
+    with pytest.raises(ConfigValidationError):
+        make_tap(mock_api={"acounts": 1})
+
+
+def test_null_mock_api_is_disabled():
+    tap = TapTaboola(
+        config={"client_id": "id", "client_secret": "secret", "mock_api": None},
+    )
+    adapter = tap.requests_session.get_adapter(TaboolaStream.url_base)
+
+    assert not isinstance(adapter, MockAPIAdapter)
@@ -0,0 +1,44 @@
+"""Tests profiling."""
+
+import threading
+
+from tap_taboola.profiling import PROFILE_OUTPUT_DIR
+
+
+def test_stacks_are_written_for_each_stream(make_tap, sync, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    tap = make_tap(
+        "accounts",
+        "campaigns",
+        mock_api={"latency": 0.05},
+        profile=True,
+        profile_stacks=True,
+    )
+    sync(tap)
+
+    for stream_name in ("accounts", "campaigns"):
+        lines = (
+            (PROFILE_OUTPUT_DIR / f"{stream_name}.collapsed").read_text().split("\n")
+        )
+
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in filter(None, lines))
+        assert any("MockAPIAdapter.send" in line for line in lines)
+
+    assert not tap.profiler.stack_sampler.stacks
+    assert not any(t.name == "tap-taboola-sampler" for t in threading.enumerate())
+
+
+def test_phases_are_timed_for_each_stream(make_tap, sync):
+    tap = make_tap("accounts", "campaigns", profile=True)
+    log = tap.profiler.log
+    logged = {}
+
+    def record_seconds(stream):
+        logged[stream.name] = dict(tap.profiler.seconds[stream.name])
+        log(stream)
+
+    tap.profiler.log = record_seconds
+    sync(tap)
+
+    assert set(logged["campaigns"]) >= {"http", "parse_response", "write"}
+    assert not tap.profiler.seconds
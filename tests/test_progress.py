@@ -0,0 +1,208 @@
+"""Tests report progress tracking."""
+
+import json
+import threading
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from tap_taboola.mock import _ACCOUNT_PATH, MockAPIAdapter
+from tap_taboola.progress import ReportProgress
+from tap_taboola.streams import CampaignSummarySiteDailyReport, _DailyReportStream
+from tests.helpers import days_ago, records
+
+START_DATE = date(2024, 1, 1)
+
+
+def test_bookmark_advances_over_contiguous_days():
+    progress = ReportProgress(START_DATE)
+
+    progress.mark_complete(date(2024, 1, 1))
+    progress.mark_complete(date(2024, 1, 2))
+
+    assert progress.bookmark == date(2024, 1, 3)
+    assert progress.completed_ranges() == []
+
+
+def test_out_of_order_days_are_kept_as_ranges():
+    progress = ReportProgress(START_DATE)
+
+    progress.mark_complete(date(2024, 1, 3))
+    progress.mark_complete(date(2024, 1, 4))
+    progress.mark_complete(date(2024, 1, 6))
+
+    assert progress.bookmark == START_DATE
+    assert progress.completed_ranges() == [
+        ("2024-01-03", "2024-01-04"),
+        ("2024-01-06", "2024-01-06"),
+    ]
+
+    progress.mark_complete(date(2024, 1, 2))
+    progress.mark_complete(date(2024, 1, 1))
+
+    assert progress.bookmark == date(2024, 1, 5)
+    assert progress.completed_ranges() == [("2024-01-06", "2024-01-06")]
+
+
+def test_resume_skips_completed_ranges():
+    progress = ReportProgress(
+        START_DATE,
+        [("2023-12-30", "2023-12-31"), ("2024-01-02", "2024-01-03")],
+    )
+
+    assert progress.bookmark == START_DATE
+    assert list(progress.pending_days(date(2024, 1, 5))) == [
+        date(2024, 1, 1),
+        date(2024, 1, 4),
+        date(2024, 1, 5),
+    ]
+
+
+def test_concurrent_completion():
+    progress = ReportProgress(START_DATE)
+    days = [START_DATE + timedelta(days=i) for i in range(100)]
+
+    threads = [
+        threading.Thread(target=lambda d=days[i::4]: [*map(progress.mark_complete, d)])
+        for i in range(4)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert progress.bookmark == START_DATE + timedelta(days=100)
+    assert progress.completed_ranges() == []
+
+
+class _InterruptingAdapter(MockAPIAdapter):
+    """Mock API that fails report requests for one day, and records days served."""
+
+    def __init__(self, interrupt_day=None, **kwargs):
+        super().__init__(**kwargs)
+        self.interrupt_day = interrupt_day
+        self.report_days = []
+
+    def send(self, request, **kwargs):
+        params = parse_qs(urlparse(request.url).query)
+        day = params["start_date"][0] if "start_date" in params else None
+
+        if day is not None and day == self.interrupt_day:
+            msg = "Interrupted"
+            raise RuntimeError(msg)
+
+        response = super().send(request, **kwargs)
+
+        if day is not None:
+            self.report_days.append(day)
+
+        return response
+
+
+def _sync_report(tap, adapter):
+    tap.requests_session.mount("https://", adapter)
+    tap.sync_all()
+
+
+def test_interrupted_report_sync_resumes_from_state(make_tap, capsys, monkeypatch):
+    # emit state as each day completes, so the last state emitted has all progress
+    monkeypatch.setattr(_DailyReportStream, "PROGRESS_STATE_FREQUENCY", 1)
+    stream_name = CampaignSummarySiteDailyReport.name
+    days = [days_ago(n) for n in range(12, -1, -1)]
+    config = {"start_date": days[0], "report_concurrency": 2}
+
+    adapter = _InterruptingAdapter(interrupt_day=days[9], accounts=1)
+
+    with pytest.raises(RuntimeError, match="Interrupted"):
+        _sync_report(make_tap(stream_name, **config), adapter)
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    state = next(m["value"] for m in reversed(messages) if m["type"] == "STATE")
+    interrupted_days = {r["date"][:10] for r in records(messages, stream_name)}
+
+    assert interrupted_days == set(days[:9])
+
+    adapter = _InterruptingAdapter(accounts=1)
+    _sync_report(make_tap(stream_name, state=state, **config), adapter)
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    resumed_days = {r["date"][:10] for r in records(messages, stream_name)}
+
+    # no day completed before the interruption is requested again, and every other
+    # day is synced
+    assert sorted(adapter.report_days) == days[9:]
+    assert resumed_days == set(days[9:])
+
+
+class _ExpiringAdapter(MockAPIAdapter):
+    """Mock API that reaches the max runtime of a tap after some report requests."""
+
+    def __init__(self, tap, expire_after=None, **kwargs):
+        super().__init__(**kwargs)
+        self.tap = tap
+        self.expire_after = expire_after
+        self.report_requests = []
+        self._requests_lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        url = urlparse(request.url)
+        params = parse_qs(url.query)
+
+        if "start_date" in params:
+            with self._requests_lock:
+                self.report_requests.append(
+                    (
+                        _ACCOUNT_PATH.fullmatch(url.path)["account_id"],
+                        params["start_date"][0],
+                    ),
+                )
+
+                if len(self.report_requests) == self.expire_after:
+                    self.tap._started_at -= self.tap.config["max_runtime"]
+
+        return super().send(request, **kwargs)
+
+
+def test_max_runtime_ends_sync_with_resumable_state(make_tap, capsys, monkeypatch):
+    monkeypatch.setattr(_DailyReportStream, "PROGRESS_STATE_FREQUENCY", 1)
+    stream_name = CampaignSummarySiteDailyReport.name
+    days = [days_ago(n) for n in range(12, 0, -1)]
+    config = {"start_date": days[0], "report_concurrency": 2, "max_runtime": 60}
+    options = {"accounts": 2, "latency": 0.01}
+
+    tap = make_tap("accounts", stream_name, **config)
+    adapter = _ExpiringAdapter(tap, expire_after=3, **options)
+    _sync_report(tap, adapter)
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    state = next(m["value"] for m in reversed(messages) if m["type"] == "STATE")
+    synced_days = {r["date"][:10] for r in records(messages, stream_name)}
+    requested_days = {day for _, day in adapter.report_requests}
+
+    # requests in flight when the runtime was reached are drained, and no further
+    # accounts are synced
+    assert len(adapter.report_requests) > 3
+    assert {account_id for account_id, _ in adapter.report_requests} == {
+        "mock-account-1"
+    }
+    assert [r["id"] for r in records(messages, "accounts")] == [1]
+    assert synced_days == requested_days
+
+    (partition,) = state["bookmarks"][stream_name]["partitions"]
+    assert partition["context"] == {"account_id": "mock-account-1"}
+
+    tap = make_tap("accounts", stream_name, state=state, **config)
+    resumed_adapter = _ExpiringAdapter(tap, **options)
+    _sync_report(tap, resumed_adapter)
+
+    # no day completed before the runtime was reached is requested again
+    resumed_days = {
+        day
+        for account_id, day in resumed_adapter.report_requests
+        if account_id == "mock-account-1"
+    }
+    assert not resumed_days & requested_days
+    assert resumed_days | requested_days >= set(days)
@@ -0,0 +1,118 @@
+"""Tests streaming report rollups."""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from tap_taboola.rollup import Rollup
+from tests.helpers import records
+
+ROWS = [
+    {
+        "campaign": "a",
+        "site_id": 1,
+        "clicks": 2,
+        "impressions": 100,
+        "visible_impressions": 50,
+        "spent": Decimal("1.5"),
+        "conversions_value": Decimal(3),
+        "cpa_actions_num": 1,
+        "currency": "USD",
+    },
+    {
+        "campaign": "a",
+        "site_id": 2,
+        "clicks": 0,
+        "impressions": 100,
+        "visible_impressions": 0,
+        "spent": Decimal("0.5"),
+        "conversions_value": Decimal(0),
+        "cpa_actions_num": 0,
+        "currency": "USD",
+    },
+]
+
+
+def test_rows_are_totalled_per_group():
+    rollup = Rollup(["campaign"])
+
+    for row in ROWS:
+        rollup.add("window", row)
+
+    (row,) = rollup.pop("window")
+
+    assert row["campaign"] == "a"
+    assert row["currency"] == "USD"
+    assert row["clicks"] == 2
+    assert row["impressions"] == 200
+    assert row["spent"] == Decimal(2)
+    assert row["ctr"] == 1
+    assert isinstance(row["ctr"], Decimal)
+    assert row["cpc"] == 1
+    assert row["cpm"] == 10
+    assert row["roas"] == Decimal("1.5")
+    assert row["cpa_conversion_rate"] == 50
+
+
+def test_ratios_are_null_without_denominator():
+    rollup = Rollup(["campaign"])
+    rollup.add("window", ROWS[1])
+
+    (row,) = rollup.pop("window")
+
+    assert row["cpc"] is None
+    assert row["cpa"] is None
+    assert row["vctr"] is None
+    assert rollup.pop("window") == []
+
+
+def test_rollup_streams_total_report_rows(make_tap, sync):
+    messages = sync(
+        make_tap(
+            "campaign_summary_site_daily_report",
+            "campaign_daily_rollup",
+            "account_daily_rollup",
+            mock_api={"accounts": 2, "campaigns_per_account": 3},
+        )
+    )
+
+    expected = defaultdict(lambda: defaultdict(int))
+
+    for row in records(messages, "campaign_summary_site_daily_report"):
+        key = (row["date"][:10], row["campaign"])
+
+        for metric in ("clicks", "impressions", "spent"):
+            expected[key][metric] += row[metric]
+
+    campaign_rows = records(messages, "campaign_daily_rollup")
+    account_rows = records(messages, "account_daily_rollup")
+
+    assert len(campaign_rows) == len(expected)
+
+    for row in campaign_rows:
+        totals = expected[(row["date"], row["campaign"])]
+
+        assert row["clicks"] == totals["clicks"]
+        assert row["impressions"] == totals["impressions"]
+        assert row["spent"] == totals["spent"]
+        assert row["ctr"] == Decimal(totals["clicks"]) * 100 / totals["impressions"]
+
+    assert sum(r["spent"] for r in account_rows) == sum(
+        totals["spent"] for totals in expected.values()
+    )
+
+
+def test_rollup_only_sync_finalizes_state(make_tap, sync):
+    messages = sync(make_tap("campaign_daily_rollup", "account_daily_rollup"))
+    state = next(m["value"] for m in reversed(messages) if m["type"] == "STATE")
+
+    for stream_name in ("campaign_daily_rollup", "account_daily_rollup"):
+        partitions = state["bookmarks"][stream_name]["partitions"]
+
+        assert partitions
+
+        for partition in partitions:
+            assert partition.keys() == {
+                "context",
+                "replication_key",
+                "replication_key_value",
+            }
@@ -0,0 +1,128 @@
+"""Tests request scheduling."""
+
+import threading
+import time
+
+import pytest
+
+from tap_taboola.scheduler import RateLimiter, RequestScheduler, iter_completed
+from tests.helpers import days_ago
+
+
+def test_planned_requests_are_prefetched():
+    scheduler = RequestScheduler(max_workers=2)
+    started = threading.Event()
+
+    def request(value):
+        started.set()
+        return value
+
+    scheduler.plan("plan", [(i, lambda i=i: request(i)) for i in range(5)])
+    started.wait(timeout=1)
+
+    assert [scheduler.result(i, lambda: None) for i in range(5)] == list(range(5))
+    scheduler.shutdown()
+
+
+def test_plan_is_only_made_once():
+    scheduler = RequestScheduler(max_workers=1)
+    calls = []
+
+    scheduler.plan("plan", [("a", lambda: calls.append("a"))])
+    scheduler.plan("plan", [("b", lambda: calls.append("b"))])
+    scheduler.result("a", lambda: None)
+    scheduler.shutdown()
+
+    assert calls == ["a"]
+
+
+def test_unplanned_request_is_made_directly():
+    scheduler = RequestScheduler(max_workers=1)
+
+    assert scheduler.result("key", lambda: "direct") == "direct"
+    scheduler.shutdown()
+
+
+def test_stopped_scheduler_only_keeps_submitted_requests():
+    scheduler = RequestScheduler(max_workers=1, lookahead=1)
+    calls = []
+
+    scheduler.plan("plan", [(i, lambda i=i: calls.append(i)) for i in range(3)])
+    scheduler.stop()
+    scheduler.plan("other", [("other", lambda: calls.append("other"))])
+
+    assert scheduler.is_submitted(0)
+    assert not scheduler.is_submitted(1)
+
+    scheduler.result(0, lambda: None)
+    scheduler.shutdown()
+
+    assert calls == [0]
+
+
+def test_requests_are_yielded_as_they_complete():
+    def request(delay):
+        time.sleep(delay)
+        return delay
+
+    requests = [(i, lambda d=d: request(d)) for i, d in enumerate([0.2, 0.1, 0])]
+    results = list(iter_completed(requests, max_workers=3))
+
+    assert results == [(2, 0), (1, 0.1), (0, 0.2)]
+
+
+def test_requests_in_flight_are_bounded():
+    in_flight = []
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def request():
+        nonlocal max_in_flight
+
+        with lock:
+            in_flight.append(None)
+            max_in_flight = max(max_in_flight, len(in_flight))
+
+        time.sleep(0.01)
+
+        with lock:
+            in_flight.pop()
+
+    list(iter_completed([(i, request) for i in range(10)], max_workers=2))
+
+    assert max_in_flight == 2
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(max_requests_per_second=20)
+    start = time.monotonic()
+
+    for _ in range(5):
+        limiter.acquire()
+
+    assert time.monotonic() - start >= 0.2 - 0.01
+
+
+def _scheduler_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("tap-taboola_")]
+
+
+def test_tap_shuts_down_scheduler_when_sync_fails(make_tap):
+    tap = make_tap("campaign_summary_site_daily_report", start_date=days_ago(30))
+    request_day = tap.streams["campaign_summary_site_daily_report"]._request_day
+
+    def fail_after_first_day(context, day):
+        if day.isoformat() > tap.config["start_date"]:
+            msg = "Failed"
+            raise RuntimeError(msg)
+
+        return request_day(context, day)
+
+    tap.streams[
+        "campaign_summary_site_daily_report"
+    ]._request_day = fail_after_first_day
+
+    with pytest.raises(RuntimeError, match="Failed"):
+        tap.sync_all()
+
+    assert not _scheduler_threads()
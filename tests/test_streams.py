@@ -0,0 +1,181 @@
+"""Tests stream post-processing."""
+
+import copy
+from datetime import date
+from decimal import Decimal
+
+from tap_taboola.mock import MockAPIAdapter
+from tests.helpers import records
+
+DAY = date(2024, 1, 1)
+
+SITE_ROWS = [
+    {
+        "date": "2024-01-01 00:00:00.0",
+        "site_id": site_id,
+        "campaign": "1",
+        "clicks": clicks,
+        "spent": Decimal("1.25"),
+    }
+    for site_id, clicks in enumerate([1, Decimal("2.0"), Decimal("2.75"), None])
+]
+
+CONTENT_ROWS = [
+    {"date": None, "item": item, "campaign": "1", "clicks": 1, "cpc": Decimal("0.5")}
+    for item in ["a", None, "b"]
+]
+
+
+def _post_process_site_row(row):
+    # per-row post-processing, before it was made for each page
+    row["date"] = row["date"].removesuffix(".0")
+    return row
+
+
+def _post_process_content_row(row, day):
+    if row["item"] is None:
+        return None
+
+    row["date"] = day.isoformat()
+    return row
+
+
+def test_site_report_page_matches_rows(make_tap):
+    stream = make_tap().streams["campaign_summary_site_daily_report"]
+    expected = [_post_process_site_row(row) for row in copy.deepcopy(SITE_ROWS)]
+
+    assert stream.post_process_page(copy.deepcopy(SITE_ROWS), DAY) == expected
+
+
+def test_content_report_page_matches_rows(make_tap):
+    stream = make_tap().streams["top_campaign_content_daily_report"]
+    expected = [
+        row
+        for row in copy.deepcopy(CONTENT_ROWS)
+        if _post_process_content_row(row, DAY) is not None
+    ]
+
+    assert stream.post_process_page(copy.deepcopy(CONTENT_ROWS), DAY) == expected
+
+
+def test_only_whole_numbers_are_converted_to_integers(make_tap):
+    stream = make_tap().streams["campaign_summary_site_daily_report"]
+    rows = stream.post_process_page(copy.deepcopy(SITE_ROWS), DAY)
+
+    assert [row["clicks"] for row in rows] == [1, 2, Decimal("2.75"), None]
+    assert [type(row["clicks"]) for row in rows] == [int, int, Decimal, type(None)]
+    assert [type(row["spent"]) for row in rows] == [Decimal] * 4
+
+
+def test_filtered_campaigns_release_prefetched_items(make_tap, sync):
+    tap = make_tap(
+        "accounts",
+        "campaigns",
+        "campaign_items",
+        mock_api={"accounts": 1, "campaigns_per_account": 3},
+        stream_maps={"campaigns": {"__filter__": "bool(id == '1000002')"}},
+    )
+    item_stream = tap.streams["campaign_items"]
+    request_campaign_items = item_stream._request_campaign_items
+    responses = []
+
+    def record_response(context):
+        responses.append(request_campaign_items(context))
+        return responses[-1]
+
+    item_stream._request_campaign_items = record_response
+    messages = sync(tap)
+
+    assert {r["campaign_id"] for r in records(messages, "campaign_items")} == {
+        "1000002"
+    }
+    assert len(responses) == 3
+    assert not item_stream.prefetched_responses
+    assert all(r.raw.closed for r in responses)
+
+
+def _final_state(messages):
+    return [m["value"] for m in messages if m["type"] == "STATE"][-1]
+
+
+def _suppressing_tap(make_tap, tmp_path, campaigns=3, state=None):
+    return make_tap(
+        "accounts",
+        "campaigns",
+        "campaign_items",
+        mock_api={"accounts": 2, "campaigns_per_account": campaigns},
+        state=state,
+        cache_dir=str(tmp_path),
+        suppress_unchanged_records=True,
+        emit_tombstones=True,
+    )
+
+
+def test_unchanged_records_are_suppressed_once_state_is_committed(
+    make_tap, sync, tmp_path
+):
+    sync(_suppressing_tap(make_tap, tmp_path))
+
+    # the state of the first run was not committed, so nothing can be suppressed
+    messages = sync(_suppressing_tap(make_tap, tmp_path))
+
+    assert len(records(messages, "campaigns")) == 6
+
+    messages = sync(_suppressing_tap(make_tap, tmp_path, state=_final_state(messages)))
+
+    assert not [m for m in messages if m["type"] == "RECORD"]
+    assert len(list(tmp_path.glob("record-hashes-mock-campaigns-*.json"))) == 2
+
+
+def test_records_of_deleted_parents_are_tombstoned(make_tap, sync, tmp_path):
+    state = _final_state(sync(_suppressing_tap(make_tap, tmp_path)))
+    messages = sync(_suppressing_tap(make_tap, tmp_path, campaigns=2, state=state))
+
+    assert {
+        (r["id"], "_sdc_deleted_at" in r) for r in records(messages, "campaigns")
+    } == {("1000003", True), ("2000003", True)}
+    assert {
+        (r["campaign_id"], "_sdc_deleted_at" in r)
+        for r in records(messages, "campaign_items")
+    } == {("1000003", True), ("2000003", True)}
+
+    # deleted records are forgotten once the state naming the index is committed
+    state = _final_state(messages)
+    messages = sync(_suppressing_tap(make_tap, tmp_path, campaigns=2, state=state))
+
+    assert not [m for m in messages if m["type"] == "RECORD"]
+
+
+class _FloatBlockingLevelAdapter(MockAPIAdapter):
+    # a float in a column that is not a number in the schema
+    def _site_row(self, *args):
+        return super()._site_row(*args) | {"blocking_level": 1.5}
+
+
+def _site_report_records(make_tap, sync, deselected=()):
+    tap = make_tap("campaign_summary_site_daily_report")
+    tap.requests_session.mount("https://", _FloatBlockingLevelAdapter())
+    stream = tap.streams["campaign_summary_site_daily_report"]
+
+    for column in deselected:
+        stream.metadata["properties", column].selected = False
+
+    stream.selected = True  # resolve the selection again
+    return {
+        (r["date"], r["site_id"], r["campaign"]): r
+        for r in records(sync(tap), stream.name)
+    }
+
+
+def test_deselected_report_columns_are_dropped(make_tap, sync):
+    deselected = {"site", "site_name", "impressions", "ctr", "cpa", "currency"}
+    all_records = _site_report_records(make_tap, sync)
+    selected_records = _site_report_records(make_tap, sync, deselected)
+
+    assert selected_records
+    assert selected_records.keys() == all_records.keys()
+
+    for key, record in selected_records.items():
+        assert record == {
+            k: v for k, v in all_records[key].items() if k not in deselected
+        }